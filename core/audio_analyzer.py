@@ -1,10 +1,37 @@
 """Real-time audio analysis for visualizers"""
+import math
 import numpy as np
 import logging
 from pathlib import Path
 import wave
 import struct
 
+try:
+    # scipy's pocketfft has a dedicated real-input path; numpy is the fallback
+    from scipy.fft import rfft as _rfft, next_fast_len as _next_fast_len
+except ImportError:
+    from numpy.fft import rfft as _rfft
+    _next_fast_len = None
+
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+
+if _njit is not None:
+    @_njit(cache=True, fastmath=True)
+    def _rms(x):
+        """Root mean square of a 1-D float32 array in a single fused loop"""
+        s = 0.0
+        for i in range(x.shape[0]):
+            s += x[i] * x[i]
+        return math.sqrt(s / x.shape[0])
+else:
+    def _rms(x):
+        """Root mean square of a 1-D float32 array (dot product avoids the x*x temporary)"""
+        return math.sqrt(float(np.dot(x, x)) / x.shape[0])
+
 
 class AudioAnalyzer:
     """Analyzes audio files to provide spectrum data for visualizers"""
@@ -18,6 +45,9 @@ class AudioAnalyzer:
         self.num_bars = 64  # Increased for finer frequency detail
         self.prev_spectrum = np.zeros(64)  # For smoothing
         self.smoothing_factor = 0.3  # 70% of new data, 30% of old data
+        if _njit is not None:
+            # Compile (or load the cached) RMS kernel now rather than on the first visualizer frame
+            _rms(np.zeros(64, dtype=np.float32))
         
     def load_file(self, file_path):
         """Load audio file for analysis"""
@@ -100,10 +130,13 @@ class AudioAnalyzer:
             
             # Apply Hanning window to reduce spectral leakage
             window = np.hanning(len(audio_chunk))
-            windowed_chunk = audio_chunk * window
+            windowed_chunk = np.ascontiguousarray(audio_chunk * window, dtype=np.float32)
             
             # Perform FFT
-            fft_data = np.fft.rfft(windowed_chunk)
+            n = len(windowed_chunk)
+            if _next_fast_len is not None:
+                n = _next_fast_len(n, real=True)
+            fft_data = _rfft(windowed_chunk, n=n)
             fft_magnitude = np.abs(fft_data)
             
             # Convert to decibels
@@ -189,10 +222,12 @@ class AudioAnalyzer:
             start = max(0, position_samples)
             end = min(len(self.audio_data), start + chunk_size)
             
-            audio_chunk = self.audio_data[start:end]
+            audio_chunk = np.ascontiguousarray(self.audio_data[start:end], dtype=np.float32)
+            if audio_chunk.shape[0] == 0:
+                return 0.0
             
             # Calculate RMS volume
-            rms = np.sqrt(np.mean(audio_chunk ** 2))
+            rms = _rms(audio_chunk)
             
             return min(rms * 5.0, 1.0)  # Boost and clamp to 0-1
             
@@ -19,6 +19,7 @@ class AudioConverter:
     
     def __init__(self):
         self.temp_files = []
+        self._prefetched_wavs = {}  # source path -> (WAV converted ahead of playback, source mtime)
         self._dotnet_checked = False
         self._dotnet_available = False
         self._sanitized_cache = {}  # path -> {'mtime': float, 'size': int, 'ok': bool}
@@ -466,9 +467,51 @@ class AudioConverter:
         return
     
     def cleanup_temp_files(self) -> None:
-        """Clean up all temporary files"""
-        cleanup_temp_files(self.temp_files)
+        """Clean up all temporary files, including prefetched WAVs nobody claimed"""
+        cleanup_temp_files(self.temp_files + [wav for wav, _ in self._prefetched_wavs.values()])
         self.temp_files = []
+        self._prefetched_wavs = {}
+
+    def store_prefetched_wav(self, source_path: str, wav_path: str, source_mtime: float) -> None:
+        """Keep a WAV converted ahead of time until it is claimed or cleaned up.
+
+        source_mtime is the source's modification time when the conversion started.
+        """
+        previous = self._prefetched_wavs.get(source_path)
+        if previous and previous[0] != wav_path:
+            cleanup_temp_files([previous[0]])
+        self._prefetched_wavs[source_path] = (wav_path, source_mtime)
+
+    def take_prefetched_wav(self, source_path: str) -> Optional[str]:
+        """Claim the prefetched WAV for source_path, if one exists.
+
+        The caller owns the returned file; pass it to track_temp_file once
+        it should be cleaned up with the other temp files.
+        """
+        entry = self._prefetched_wavs.pop(source_path, None)
+        if entry is None:
+            return None
+        wav_path, source_mtime = entry
+        try:
+            current_mtime = os.stat(source_path).st_mtime
+        except OSError:
+            current_mtime = None
+        if current_mtime != source_mtime:
+            # The source was edited after it was converted
+            cleanup_temp_files([wav_path])
+            return None
+        if os.path.exists(wav_path):
+            return wav_path
+        return None
+
+    def track_temp_file(self, path: str) -> None:
+        """Register a file for removal by cleanup_temp_files"""
+        self.temp_files.append(path)
+
+    def release_temp_file(self, path: str) -> None:
+        """Stop tracking a temp file without deleting it (ownership moves to the caller)"""
+        if path in self.temp_files:
+            self.temp_files.remove(path)
 
     def _read_scd_volume(self, scd_path: Path) -> Optional[tuple]:
         """Read current SCD gain float and position; returns (gain, offset) or None"""
@@ -1,6 +1,7 @@
 """File system watcher for library changes"""
 import logging
 import os
+import stat
 from pathlib import Path
 from typing import List, Callable, Set
 from PyQt5.QtCore import QFileSystemWatcher, QObject, pyqtSignal, QTimer
@@ -10,7 +11,7 @@ class LibraryFileWatcher(QObject):
     """Watch library folders for file changes and trigger updates"""
     
     # Signals for file changes
-    file_added = pyqtSignal(str)  # file_path
+    file_added = pyqtSignal(str, 'qint64', float)  # file_path, size (64-bit: files can exceed 2 GiB), mtime
     file_removed = pyqtSignal(str)  # file_path
     file_modified = pyqtSignal(str)  # file_path
     directory_added = pyqtSignal(str)  # directory_path - for KH Rando folder detection
@@ -194,19 +195,25 @@ class LibraryFileWatcher(QObject):
                         # Recursively scan new subdirectories for files
                         self._scan_new_directory_recursive(subdir)
             
-            # Get current files in THIS directory only (not recursive for existing scan)
-            current_files = set()
-            for file in dir_path.iterdir():
-                if file.is_file() and self._is_supported_file(str(file)):
-                    current_files.add(str(file))
+            # Get current files in THIS directory only (not recursive for existing scan),
+            # keeping the scandir stat so listeners don't have to stat again
+            current_files = {}
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and self._is_supported_file(entry.path):
+                        current_files[entry.path] = entry
             
             # Get watched files that are in this specific directory
             watched_in_dir = {f for f in self.watched_files if Path(f).parent == dir_path}
             
             # Detect new files
-            for file_path in current_files:
+            for file_path, entry in current_files.items():
                 if file_path not in self.watched_files:
-                    self.file_added.emit(file_path)
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    self.file_added.emit(file_path, st.st_size, st.st_mtime)
                     self.watched_files.add(file_path)
             
             # Detect removed files (only in this directory)
@@ -227,12 +234,16 @@ class LibraryFileWatcher(QObject):
             
             # Recursively find all files
             for file_path in dir_path.rglob('*'):
-                if file_path.is_file() and self._is_supported_file(str(file_path)):
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode) and self._is_supported_file(str(file_path)):
                     file_str = str(file_path)
                     if file_str not in self.watched_files:
-                        self.file_added.emit(file_str)
+                        self.file_added.emit(file_str, st.st_size, st.st_mtime)
                         self.watched_files.add(file_str)
-                elif file_path.is_dir():
+                elif stat.S_ISDIR(st.st_mode):
                     # Add subdirectories to watcher
                     dir_str = str(file_path)
                     if dir_str not in self.watched_folders:
@@ -244,6 +244,25 @@ class KHRandoExporter:
             self.detected_folders = self.detect_folders(self.kh_rando_path)
             self.existing_files = self.scan_existing_files(self.kh_rando_path)
     
+    def refresh_category_files(self, category: str) -> None:
+        """Rescan a single category folder into the existing files cache"""
+        if not self.kh_rando_path:
+            return
+        if category not in self.existing_files:
+            self.refresh_existing_files()
+            return
+        actual_folder_name = self.find_actual_folder_name(self.kh_rando_path, category)
+        category_path = os.path.join(self.kh_rando_path, actual_folder_name)
+        files = set()
+        if os.path.exists(category_path):
+            try:
+                for file in os.listdir(category_path):
+                    if file.lower().endswith('.scd'):
+                        files.add(file.lower())
+            except (OSError, PermissionError):
+                pass
+        self.existing_files[category] = files
+
     def get_categories(self) -> Dict[str, str]:
         """Get the categories to use (detected folders or default)"""
         if self.detected_folders:
@@ -3,12 +3,39 @@ import logging
 import os
 from pathlib import Path
 from typing import List, Optional
+from PyQt5 import sip
 from PyQt5.QtWidgets import QListWidget, QListWidgetItem
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
 from utils.helpers import format_file_size
 
 
+# Item data roles on list rows; Qt.UserRole itself holds the row's path
+# KH Rando rows: the row's category key, and whether it is a category header
+KH_CATEGORY_ROLE = Qt.UserRole + 1
+KH_HEADER_ROLE = Qt.UserRole + 2
+# Library rows: the search haystack, stored once so the search filter doesn't
+# rebuild it on every keystroke
+SEARCH_HAYSTACK_ROLE = Qt.UserRole + 3
+# Marks folder header rows in the grouped library view
+FOLDER_HEADER_ROLE = Qt.UserRole + 4
+# Library rows: the lowercased extension the selection and menu handlers check
+LOWER_EXT_ROLE = Qt.UserRole + 5
+
+
+def search_haystack(text: str, file_path: str) -> str:
+    """Lowercased row text and folder joined by a NUL, so one substring test covers both
+    without a query matching across the boundary"""
+    folder = os.path.dirname(file_path) if file_path else ""
+    return f"{text.lower()}\0{folder.lower()}"
+
+
+def set_search_keys(item: QListWidgetItem, file_path: str) -> None:
+    """Store the search haystack and lowercased extension of a library row"""
+    item.setData(SEARCH_HAYSTACK_ROLE, search_haystack(item.text(), file_path))
+    item.setData(LOWER_EXT_ROLE, os.path.splitext(file_path)[1].lower())
+
+
 class AudioLibrary:
     """Manage audio file library scanning and organization"""
     
@@ -21,6 +48,9 @@ class AudioLibrary:
         self.kh_categories = kh_categories or {}  # Category mapping
         self.kh_rando_files_by_category = {}  # Store files by category for population
         self.progress_callback = None  # Callback for progress updates
+        self.file_sizes = {}  # path -> size in bytes, filled from scandir stat results
+        self.file_list_index = {}  # path -> QListWidgetItem added to file_list
+        self.kh_rando_path_category = {}  # path -> KH category key holding it
         
     def set_progress_callback(self, callback):
         """Set callback function for progress updates: callback(current, total, filename)"""
@@ -29,9 +59,12 @@ class AudioLibrary:
     def scan_folders(self, folders: List[str], scan_subdirs: bool = True, kh_rando_folder: str = "") -> None:
         """Scan library folders for supported audio files"""
         self.file_list.clear()
+        self.file_sizes = {}
+        self.file_list_index = {}
         
         # Clear KH Rando files tracking
         self.kh_rando_files_by_category = {}
+        self.kh_rando_path_category = {}
         for category_key in self.kh_categories.keys():
             self.kh_rando_files_by_category[category_key] = []
         
@@ -65,9 +98,17 @@ class AudioLibrary:
         for folder_path, should_scan_subdirs in all_scan_paths:
             current_file_count = self._scan_single_folder(folder_path, should_scan_subdirs, current_file_count, kh_rando_path_obj)
         
+        # Keep category lists in sorted order so the UI can populate without re-sorting
+        self._sort_kh_rando_categories()
+        
         # Force update of KH Rando list after scan completion
         self._update_kh_rando_list()
     
+    def _sort_kh_rando_categories(self):
+        """Sort each KH Rando category's (path, display) list in place"""
+        for category_files in self.kh_rando_files_by_category.values():
+            category_files.sort()
+    
     def _update_kh_rando_list(self):
         """Signal that KH Rando list should be updated"""
         # The main window will call _populate_kh_rando_list which reads self.kh_rando_files_by_category
@@ -80,26 +121,43 @@ class AudioLibrary:
                 logging.warning(f"Folder not found or not a directory: {folder_path}")
                 return current_count
                 
-            if scan_subdirs:
-                # Recursively scan all subdirectories
-                for file_path in folder_path.rglob('*'):
-                    if file_path.is_file() and self._is_supported_file(file_path):
-                        self._add_file_to_library(file_path, kh_rando_path_obj)
-                        current_count += 1
-                        
-                        # Report progress (without total since we don't pre-count)
-                        if self.progress_callback:
-                            self.progress_callback(current_count, 0, file_path.name)
-            else:
-                # Only scan immediate directory
-                for file_path in folder_path.iterdir():
-                    if file_path.is_file() and self._is_supported_file(file_path):
-                        self._add_file_to_library(file_path, kh_rando_path_obj)
-                        current_count += 1
-                        
-                        # Report progress (without total since we don't pre-count)
-                        if self.progress_callback:
-                            self.progress_callback(current_count, 0, file_path.name)
+            # Walk with os.scandir so the stat result cached on each DirEntry
+            # (free on Windows) supplies the file size without another syscall
+            pending_dirs = [str(folder_path)]
+            while pending_dirs:
+                current_dir = pending_dirs.pop()
+                # Resolve KH Rando membership once per directory rather than per file
+                dir_in_kh_rando = False
+                if kh_rando_path_obj:
+                    try:
+                        dir_in_kh_rando = Path(current_dir).resolve().is_relative_to(kh_rando_path_obj)
+                    except (ValueError, OSError):
+                        pass
+                try:
+                    with os.scandir(current_dir) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    if scan_subdirs:
+                                        pending_dirs.append(entry.path)
+                                    continue
+                                if not entry.is_file():
+                                    continue
+                                if os.path.splitext(entry.name)[1].lower() not in self.SUPPORTED_EXTENSIONS:
+                                    continue
+                                size = entry.stat().st_size
+                            except OSError:
+                                continue
+                            
+                            self.file_sizes[entry.path] = size
+                            self._add_file_to_library(Path(entry.path), kh_rando_path_obj, size=size, is_in_kh_rando=dir_in_kh_rando)
+                            current_count += 1
+                            
+                            # Report progress (without total since we don't pre-count)
+                            if self.progress_callback:
+                                self.progress_callback(current_count, 0, entry.name)
+                except (OSError, PermissionError) as e:
+                    logging.warning(f"Error scanning folder {current_dir}: {e}")
                             
         except (OSError, PermissionError) as e:
             logging.warning(f"Error scanning folder {folder_path}: {e}")
@@ -110,24 +168,29 @@ class AudioLibrary:
         """Check if file has a supported extension"""
         return file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS
         
-    def _add_file_to_library(self, file_path: Path, kh_rando_path_obj: Path = None) -> None:
-        """Add a single file to the library list"""
+    def _add_file_to_library(self, file_path: Path, kh_rando_path_obj: Path = None, size: Optional[int] = None,
+                             is_in_kh_rando: Optional[bool] = None) -> None:
+        """Add a single file to the library list (size may come from a cached scandir stat,
+        KH Rando membership from a per-directory check)"""
         try:
-            if not file_path.exists():
-                return
-                
-            size = file_path.stat().st_size
+            if size is None:
+                if not file_path.exists():
+                    return
+                size = file_path.stat().st_size
+                self.file_sizes[str(file_path)] = size
             filename = file_path.name
             
-            # Fast check if file is in KH Rando folder using pre-computed path
-            is_in_kh_rando = False
-            if kh_rando_path_obj:
-                try:
-                    # Use Path.is_relative_to() for cross-platform relative path checking
-                    # resolve() ensures both paths are absolute and normalized
-                    is_in_kh_rando = file_path.resolve().is_relative_to(kh_rando_path_obj)
-                except (ValueError, OSError):
-                    pass
+            # Fast check if file is in KH Rando folder using pre-computed path,
+            # unless the caller already knows from the containing directory
+            if is_in_kh_rando is None:
+                is_in_kh_rando = False
+                if kh_rando_path_obj:
+                    try:
+                        # Use Path.is_relative_to() for cross-platform relative path checking
+                        # resolve() ensures both paths are absolute and normalized
+                        is_in_kh_rando = file_path.resolve().is_relative_to(kh_rando_path_obj)
+                    except (ValueError, OSError):
+                        pass
             
             # If in KH Rando folder, categorize and return early
             if is_in_kh_rando and self.kh_rando_file_list and self.kh_rando_exporter:
@@ -145,12 +208,11 @@ class AudioLibrary:
                                 
                                 # Check if file already exists in this category (avoid duplicates)
                                 file_path_str = str(file_path)
-                                already_exists = any(fpath == file_path_str for fpath, _ in self.kh_rando_files_by_category[cat_key])
-                                
-                                if not already_exists:
+                                if file_path_str not in self.kh_rando_path_category:
                                     # Add to category tracking
                                     simple_display = f"{filename} ({format_file_size(size)})"
                                     self.kh_rando_files_by_category[cat_key].append((file_path_str, simple_display))
+                                    self.kh_rando_path_category[file_path_str] = cat_key
                                 
                                 return  # Don't add to main list
                         break
@@ -174,18 +236,15 @@ class AudioLibrary:
             
             # Check if file already exists in main library (avoid duplicates)
             file_path_str = str(file_path)
-            for i in range(self.file_list.count()):
-                existing_item = self.file_list.item(i)
-                if existing_item:
-                    item_data = existing_item.data(Qt.UserRole)
-                    # Skip folder headers and check file path
-                    if item_data and not item_data.startswith("FOLDER_HEADER:") and item_data == file_path_str:
-                        # File already exists, don't add duplicate
-                        return
+            existing_item = self.file_list_index.get(file_path_str)
+            if existing_item is not None and not sip.isdeleted(existing_item) and existing_item.listWidget() is self.file_list:
+                # File already exists, don't add duplicate
+                return
             
             item = QListWidgetItem(display_text)
             item.setToolTip(str(file_path))
             item.setData(Qt.UserRole, file_path_str)
+            set_search_keys(item, file_path_str)
             
             # Color code duplicates
             if kh_status:
@@ -193,6 +252,7 @@ class AudioLibrary:
             
             # Add to regular library list
             self.file_list.addItem(item)
+            self.file_list_index[file_path_str] = item
             
         except OSError as e:
             logging.warning(f"Error adding file to library {file_path}: {e}")
@@ -233,10 +293,13 @@ class AudioLibrary:
         except ValueError:
             return -1
     
-    def _add_single_file(self, file_path: Path):
-        """Add a single file to the library without full rescan"""
-        if not file_path.exists() or not file_path.is_file():
-            return
+    def _add_single_file(self, file_path: Path, size: Optional[int] = None):
+        """Add a single file to the library without full rescan (size may come from the watcher's stat)"""
+        if size is None:
+            if not file_path.exists() or not file_path.is_file():
+                return
+        else:
+            self.file_sizes[str(file_path)] = size
         
         if not self._is_supported_file(file_path):
             return
@@ -251,7 +314,8 @@ class AudioLibrary:
                     pass
             
             # Use the existing _add_file_to_library method
-            self._add_file_to_library(file_path, kh_rando_path_obj)
+            self._add_file_to_library(file_path, kh_rando_path_obj, size)
+            self._sort_kh_rando_categories()
             logging.info(f"Added file to library: {file_path}")
         except Exception as e:
             logging.error(f"Error adding file {file_path}: {e}")
@@ -1,17 +1,31 @@
 """Background threading for file operations"""
+import logging
+import os
+import threading
 from pathlib import Path
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from utils.helpers import cleanup_temp_files
 
 
-class FileLoadThread(QThread):
-    """Thread for loading files in the background"""
-    finished = pyqtSignal(str)  # Signal emitted when file loading is complete
-    error = pyqtSignal(str)     # Signal emitted when an error occurs
-    
-    def __init__(self, file_path: str):
+class LoadTaskSignals(QObject):
+    """Signals for LoadTask; each carries the token of the load request"""
+    finished = pyqtSignal(str, int)  # Emitted with the validated path when loading is complete
+    error = pyqtSignal(str, int)     # Emitted with an error message when loading fails
+
+
+class LoadTask(QRunnable):
+    """Pool task for loading a file in the background.
+
+    The token lets the receiver drop results from loads that were superseded
+    by a newer request before they finished.
+    """
+
+    def __init__(self, file_path: str, token: int, signals: LoadTaskSignals):
         super().__init__()
         self.file_path = file_path
-        
+        self.token = token
+        self.signals = signals
+
     def run(self):
         """Run the file loading operation"""
         try:
@@ -19,16 +33,87 @@ class FileLoadThread(QThread):
             
             # Validate file exists
             if not file_path.exists():
-                self.error.emit(f"File not found: {self.file_path}")
+                self.signals.error.emit(f"File not found: {self.file_path}", self.token)
                 return
                 
             # Validate file is readable
             if not file_path.is_file():
-                self.error.emit(f"Path is not a file: {self.file_path}")
+                self.signals.error.emit(f"Path is not a file: {self.file_path}", self.token)
                 return
             
             # Emit success signal with the validated path
-            self.finished.emit(str(file_path))
+            self.signals.finished.emit(str(file_path), self.token)
             
         except Exception as e:
-            self.error.emit(f"Error loading file: {e}")
+            self.signals.error.emit(f"Error loading file: {e}", self.token)
+
+
+class PrefetchTaskSignals(QObject):
+    """Signals for PrefetchTask, tracking WAVs handed over until the receiver claims them"""
+    ready = pyqtSignal(str, str, float)  # Emitted with (source path, converted WAV path, source mtime)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._unclaimed = set()
+        self._closed = False
+
+    def hand_over(self, source_path: str, wav_path: str, source_mtime: float) -> bool:
+        """Emit ready for wav_path; returns False after close(), leaving the file with the caller"""
+        with self._lock:
+            if self._closed:
+                return False
+            self._unclaimed.add(wav_path)
+        self.ready.emit(source_path, wav_path, source_mtime)
+        return True
+
+    def claim(self, wav_path: str) -> None:
+        """Mark a handed-over WAV as received"""
+        with self._lock:
+            self._unclaimed.discard(wav_path)
+
+    def close(self) -> list:
+        """Refuse further WAVs and return those emitted but never claimed"""
+        with self._lock:
+            self._closed = True
+            unclaimed, self._unclaimed = list(self._unclaimed), set()
+        return unclaimed
+
+
+class PrefetchTask(QRunnable):
+    """Pool task that converts an upcoming track to a playback WAV ahead of time."""
+
+    _local = threading.local()
+
+    def __init__(self, file_path: str, signals: PrefetchTaskSignals):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = signals
+
+    def _get_thread_converter(self):
+        from core.converter import AudioConverter
+
+        converter = getattr(self._local, "converter", None)
+        if converter is None:
+            converter = AudioConverter()
+            self._local.converter = converter
+        return converter
+
+    def run(self):
+        converter = self._get_thread_converter()
+        try:
+            # Taken before converting, so an edit made meanwhile makes the WAV stale
+            source_mtime = os.stat(self.file_path).st_mtime
+            if os.path.splitext(self.file_path)[1].lower() == '.scd':
+                wav_path = converter.convert_scd_to_wav(self.file_path)
+            else:
+                wav_path = converter.convert_to_wav_temp(self.file_path)
+        except Exception as e:
+            logging.debug(f"Prefetch failed for {self.file_path}: {e}")
+            return
+        if wav_path:
+            # The receiving converter takes ownership of the file
+            converter.release_temp_file(wav_path)
+            if not self.signals.hand_over(self.file_path, wav_path, source_mtime):
+                # The app is shutting down; nobody will claim it
+                cleanup_temp_files([wav_path])
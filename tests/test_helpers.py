@@ -0,0 +1,39 @@
+"""Tests for utils.helpers"""
+import os
+
+from utils.helpers import existing_paths
+
+
+def _touch(path):
+    with open(path, 'wb'):
+        pass
+
+
+def test_existing_paths_few_files_are_stat_checked(tmp_path):
+    present = tmp_path / "a.scd"
+    _touch(present)
+    missing = tmp_path / "b.scd"
+    assert existing_paths([str(present), str(missing)]) == {str(present)}
+
+
+def test_existing_paths_lists_shared_folders(tmp_path):
+    paths = [str(tmp_path / f"track{i}.scd") for i in range(6)]
+    for path in paths[:4]:
+        _touch(path)
+    (tmp_path / "track4.scd").mkdir()
+    assert existing_paths(paths) == set(paths[:4])
+
+
+def test_existing_paths_missing_folder(tmp_path):
+    paths = [str(tmp_path / "gone" / f"track{i}.scd") for i in range(5)]
+    assert existing_paths(paths) == set()
+
+
+def test_existing_paths_matches_names_through_normcase(tmp_path, monkeypatch):
+    # Simulate a case-insensitive filesystem, where the listed name's case can
+    # differ from the path the library holds
+    monkeypatch.setattr(os.path, 'normcase', str.lower)
+    for i in range(5):
+        _touch(tmp_path / f"Track{i}.SCD")
+    paths = [str(tmp_path / f"track{i}.scd") for i in range(5)]
+    assert existing_paths(paths) == set(paths)
@@ -4,6 +4,7 @@ import tempfile
 from PyQt5.QtWidgets import QMessageBox, QLabel, QDialog, QVBoxLayout, QApplication, QSlider, QPushButton, QHBoxLayout
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
 from ui.dialogs import show_themed_message, show_themed_file_dialog
+from utils.helpers import clear_stat_cache
 
 
 class QualitySelectionDialog(QDialog):
@@ -414,6 +415,8 @@ class ConversionManager:
     def _conversion_finished(self, success, message):
         """Handle conversion completion"""
         self.status_dialog.close_dialog()
+        # Outputs may have overwritten existing files, watched or not
+        clear_stat_cache()
         
         if success:
             show_themed_message(self.main_window, QMessageBox.Information, 'Conversion Complete', message)
@@ -448,6 +451,7 @@ class ConversionManager:
         if save_path:
             if file_ext == '.scd':
                 wav = self.converter.convert_scd_to_wav(self.main_window.current_file, out_path=save_path)
+                clear_stat_cache(save_path)
                 if wav:
                     show_themed_message(self.main_window, QMessageBox.Information, 'Conversion Complete', f'WAV saved to: {save_path}')
                     # File watcher will automatically update the library
@@ -455,6 +459,7 @@ class ConversionManager:
                     show_themed_message(self.main_window, QMessageBox.Warning, 'Conversion Failed', 'Could not convert SCD to WAV.')
             else:
                 success = self.converter.convert_with_ffmpeg(self.main_window.current_file, save_path, 'wav')
+                clear_stat_cache(save_path)
                 if success:
                     show_themed_message(self.main_window, QMessageBox.Information, 'Conversion Complete', f'WAV saved to: {save_path}')
                     # File watcher will automatically update the library
@@ -527,6 +532,9 @@ class ConversionManager:
             # Convert WAV to SCD using original file as template if it's SCD
             original_scd_template = self.main_window.current_file if file_ext == '.scd' else None
             success = self.converter.convert_wav_to_scd(source_file, save_path, original_scd_template, selected_quality)
+            # A loaded WAV is loudness-normalized in place before encoding
+            clear_stat_cache(source_file)
+            clear_stat_cache(save_path)
             
             # Cleanup temp file
             if temp_wav:
@@ -9,6 +9,10 @@ from core.kh_rando import KHRandoExportDialog
 from ui.dialogs import show_themed_message
 from ui.conversion_manager import SimpleStatusDialog, QualitySelectionDialog
 
+# Extensions that are converted to SCD on export; checked for every selected/listed file
+_AUDIO_CONVERT_EXTS = frozenset({'.wav', '.mp3', '.ogg', '.flac'})
+_EXPORTABLE_EXTS = _AUDIO_CONVERT_EXTS | {'.scd'}
+
 
 class KHRandoManager:
     """Handles KH Rando export and management operations"""
@@ -38,7 +42,7 @@ class KHRandoManager:
                 file_ext = os.path.splitext(file_path)[1].lower()
                 if file_ext == '.scd':
                     scd_files.append(file_path)
-                elif file_ext in ['.wav', '.mp3', '.ogg', '.flac']:
+                elif file_ext in _AUDIO_CONVERT_EXTS:
                     files_to_convert.append(file_path)
         
         # Show quality selection dialog if there are files to convert
@@ -166,7 +170,7 @@ Quality: {selected_quality}/10
             file_path = item.data(Qt.UserRole)
             if file_path and os.path.exists(file_path):
                 file_ext = os.path.splitext(file_path)[1].lower()
-                if file_ext in ['.scd', '.wav', '.mp3', '.ogg', '.flac']:
+                if file_ext in _EXPORTABLE_EXTS:
                     # Double-check: use both color coding and direct KH Rando check
                     text_color = item.foreground().color().name() if item.foreground().color().isValid() else '#ffffff'
                     is_colored = text_color in ['#90ee90', '#ffa500']  # Green or orange
@@ -3,12 +3,15 @@ import os
 import shutil
 import tempfile
 import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 
 from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-from PyQt5.QtCore import QMimeData, QObject, QThread, QTimer, Qt, QUrl, pyqtSignal
-from PyQt5.QtGui import QColor, QCursor, QDrag, QFont, QPainter, QPixmap
+from PyQt5 import sip
+from PyQt5.QtCore import QMimeData, QObject, QRunnable, QThread, QThreadPool, QTimer, Qt, QUrl, pyqtSignal
+from PyQt5.QtGui import QColor, QCursor, QDrag, QFont, QPainter, QPixmap, QPixmapCache
 from PyQt5.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -32,14 +35,120 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+from ui.conversion_manager import QualitySelectionDialog, SimpleStatusDialog
 from ui.dialogs import show_themed_file_dialog, show_themed_message, apply_title_bar_theming
-from utils.helpers import format_time, send_to_recycle_bin
-from core.library import AudioLibrary
+from utils.helpers import (
+    cached_stat,
+    clear_stat_cache,
+    existing_paths,
+    format_file_size,
+    format_time,
+    send_files_to_recycle_bin,
+)
+from core.library import (
+    FOLDER_HEADER_ROLE,
+    KH_CATEGORY_ROLE,
+    KH_HEADER_ROLE,
+    LOWER_EXT_ROLE,
+    SEARCH_HAYSTACK_ROLE,
+    AudioLibrary,
+    search_haystack,
+    set_search_keys,
+)
+
+
+# How long a cached os.path.exists() result stays valid (seconds)
+_EXISTS_CACHE_TTL = 0.5
+
+# Extensions the loop editor can open
+_LOOP_EDITOR_EXTS = frozenset({'.scd', '.wav'})
+
+# Minimum spacing between processed drag-move events over the same row (ms)
+_DRAG_MOVE_INTERVAL_MS = 16
+
+# How long a rename of ours waits for the watcher's matching remove/add events (seconds)
+_RENAME_SUPPRESS_WINDOW = 2.0
+
+# Quiet period before queued file watcher add/remove events are applied (ms)
+_FS_EVENT_DEBOUNCE_MS = 150
+
+# Typing pause before the library search filter runs (ms)
+_SEARCH_DEBOUNCE_MS = 150
+
+# Minimum spacing between scan overlay progress updates, each of which pumps the event loop (seconds)
+_SCAN_PROGRESS_INTERVAL = 0.05
+
+# Suffixes exported to KH Rando as-is vs. converted to SCD first
+_SCD_EXTS = ('.scd',)
+_CONVERT_EXTS = ('.wav', '.mp3', '.ogg', '.flac')
+
+# Delay before the list refresh after a KH Rando export, so back-to-back exports share one (ms)
+_POST_EXPORT_REFRESH_MS = 200
+
+
+def _normalized_real_path(path):
+    """Canonical, case-normalized form of path for prefix comparisons."""
+    return os.path.normcase(os.path.realpath(path))
+
+
+def _root_prefix(root):
+    return root if root.endswith(os.sep) else root + os.sep
+
+
+def _folder_group_name(file_path):
+    """Name of the folder group a file is listed under when organizing by folder."""
+    folder = os.path.dirname(file_path)
+    return os.path.basename(folder) if folder and folder != "." else "Files (No Folder)"
+
+
+def _folder_entry_key(entry):
+    """Sort key for a (text, path, color) folder cache entry: its file name, case-insensitively."""
+    return os.path.basename(entry[1]).lower()
+
+
+def _item_ext(item, file_path):
+    """Lowercased extension of a row's file, from the stored role when the row has one."""
+    ext = item.data(LOWER_EXT_ROLE)
+    if ext is None:
+        ext = os.path.splitext(file_path)[1].lower()
+    return ext
+
+
+def _insort_folder_entry(entries, entry):
+    """Insert entry into a sorted folder cache bucket, computing keys only for the probed entries."""
+    key = _folder_entry_key(entry)
+    lo, hi = 0, len(entries)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key < _folder_entry_key(entries[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    entries.insert(lo, entry)
+
+
+@contextmanager
+def _frozen_list(list_widget):
+    """Suspend sorting, repaints and signals on a list widget while it is rebuilt."""
+    was_sorting = list_widget.isSortingEnabled()
+    was_updating = list_widget.updatesEnabled()
+    list_widget.setSortingEnabled(False)
+    list_widget.setUpdatesEnabled(False)
+    was_blocked = list_widget.blockSignals(True)
+    try:
+        yield list_widget
+    finally:
+        list_widget.blockSignals(was_blocked)
+        list_widget.setUpdatesEnabled(was_updating)
+        list_widget.setSortingEnabled(was_sorting)
 
 
 class LibraryController:
     """Encapsulate library, KH Rando, and context menu logic for SCDToolkit."""
 
+    # Font for drag pixmaps; built on first drag since QFont needs a running QApplication
+    _DRAG_FONT = None
+
     def __init__(self, window):
         self.window = window
         self._updating_selection = False
@@ -47,13 +156,92 @@ class LibraryController:
         self.kh_rando_category_states = {}
         self._files_by_folder_cache = {}
         self._folder_expanded_states = {}
+        self._last_search_text = None  # search text the current row visibility reflects
+        self._file_entries = None  # snapshot of file_list rows for searching, see _get_file_entries
+        self._visible_row_indices = None  # _file_entries indices the last search left visible
+        self._collapsed_haystacks = {}  # folder name -> search haystacks of its cached, unlisted files
+        self._folder_header_items = {}  # folder name -> header row item in organized view
+        self._folder_order = []  # folder names in header order
         self._drag_hover_item = None
+        self._last_drag_row = None
+        self._last_drag_time = 0
+        self._kh_category_headers = {}  # category key -> header item
+        self._export_thread = None
+        self._export_worker = None
+        self._export_dialog = None
+        # Resolved library/KH Rando roots, rebuilt when the configured folders change
+        self._roots_key = None
+        self._resolved_library_roots = []  # (root, root + sep)
+        self._resolved_kh_rando_root = None  # (root, root + sep) or None
+        self._realpath_cache = {}  # raw path -> normalized realpath
+        # Widgets built by create_library_panel
+        self.search_input = None
+        self.organize_by_folder_cb = None
+        self.kh_rando_file_list = None
         self.library = None
+        self._exists_cache = {}  # path -> (exists, timestamp)
+        self._shared_mini_visualizer = None  # single "now playing" indicator, reused across rows
+        self._current_visualizer_file = None
+        self._current_visualizer_item = None
+        self._path_to_item = {}  # file path -> [(list_widget, item)] for rows currently shown
+
+        # Context menus are built on first use and reused afterwards
+        self._file_list_menu = None
+        self._file_list_actions = {}
+        self._kh_rando_menu = None
+        self._kh_rando_actions = {}
+        self._context_menu_path = None
+
+        # Renames done from the UI are applied in place; the watcher's matching
+        # remove/add pair is folded into the same update
+        self._pending_renames = {}  # old path -> new path
+        self._recent_rename_paths = {}  # old or new path -> (watcher event still owed, expiry time)
+        self._rename_timer = QTimer()
+        self._rename_timer.setSingleShot(True)
+        self._rename_timer.setInterval(50)
+        self._rename_timer.timeout.connect(self._flush_pending_renames)
+
+        # Category -> its KH Rando file names from before the first export since its last refresh
+        self._export_baselines = {}
+
+        # Watcher add/remove events are collected and applied as one batch
+        self._pending_adds = {}  # path -> size from the watcher (None if unknown)
+        self._pending_removes = set()
+        self._fs_flush_timer = QTimer()
+        self._fs_flush_timer.setSingleShot(True)
+        self._fs_flush_timer.setInterval(_FS_EVENT_DEBOUNCE_MS)
+        self._fs_flush_timer.timeout.connect(self._flush_fs_events)
+
+        # Search edits are filtered once typing pauses; direct filter_library_files calls still run at once
+        self._search_timer = QTimer()
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.filter_library_files)
         
+        # Categories exported to since the last post-export refresh
+        self._post_export_categories = set()
+        self._post_export_timer = QTimer()
+        self._post_export_timer.setSingleShot(True)
+        self._post_export_timer.setInterval(_POST_EXPORT_REFRESH_MS)
+        self._post_export_timer.timeout.connect(self._flush_post_export_refresh)
+
         # KH2 Hook auto-connect
         self._kh2_hook_monitor_thread = None
         self._kh2_hook_monitor_worker = None
 
+    def _exists(self, path):
+        """os.path.exists() with a short-lived cache for repeated probes of the same path."""
+        now = time.monotonic()
+        cached = self._exists_cache.get(path)
+        if cached is not None and now - cached[1] < _EXISTS_CACHE_TTL:
+            return cached[0]
+        exists = os.path.exists(path)
+        self._exists_cache[path] = (exists, now)
+        return exists
+
+    def _invalidate_exists(self, path):
+        self._exists_cache.pop(path, None)
+
     # UI construction
     def create_library_panel(self):
         """Build the library panel UI and wire signals."""
@@ -92,8 +280,7 @@ class LibraryController:
         self.folder_list.setMaximumHeight(100)
         self.folder_list.itemSelectionChanged.connect(self.on_folder_selection_changed)
         self.folder_list.setStyleSheet("QListWidget::item:selected{outline:0;} QListWidget::item:focus{outline:0;}")
-        for folder in w.config.library_folders:
-            self.folder_list.addItem(folder)
+        self.folder_list.addItems(w.config.library_folders)
         self.remove_folder_btn.setEnabled(False)
         header_layout.addWidget(self.folder_list)
 
@@ -178,7 +365,7 @@ class LibraryController:
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search files... (filename or folder)")
-        self.search_input.textChanged.connect(self.filter_library_files)
+        self.search_input.textChanged.connect(self._on_search_text_changed)
         search_container.addWidget(self.search_input)
         w.search_input = self.search_input
 
@@ -243,6 +430,12 @@ class LibraryController:
         self.file_list.startDrag = lambda supportedActions: self.start_file_drag(self.file_list, supportedActions)
         self.file_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.file_list.customContextMenuRequested.connect(self.show_file_list_context_menu)
+        # Any change to the rows means the last filter pass no longer describes them
+        model = self.file_list.model()
+        model.rowsInserted.connect(self._invalidate_filter)
+        model.rowsRemoved.connect(self._invalidate_filter)
+        model.modelReset.connect(self._invalidate_filter)
+        model.dataChanged.connect(self._invalidate_filter)
         regular_files_layout.addWidget(self.file_list)
 
         regular_files_widget.setLayout(regular_files_layout)
@@ -401,7 +594,7 @@ class LibraryController:
             return
 
         selected_items = []
-        if hasattr(self, 'kh_rando_file_list'):
+        if self.kh_rando_file_list is not None:
             selected_items = self.kh_rando_file_list.selectedItems()
 
         file_items = []
@@ -428,7 +621,7 @@ class LibraryController:
             self.window.config.library_folders.append(folder)
             self.folder_list.addItem(folder)
             self.window.config.save_settings()
-            if hasattr(self.window, 'file_watcher') and self.window.file_watcher:
+            if self.window.file_watcher is not None:
                 self.window.file_watcher.scan_initial_files([folder], self.window.config.scan_subdirs)
                 self.window.file_watcher.add_watch_paths([folder], self.window.config.scan_subdirs)
             self.rescan_library()
@@ -440,7 +633,7 @@ class LibraryController:
             self.window.config.library_folders.pop(current_row)
             self.folder_list.takeItem(current_row)
             self.window.config.save_settings()
-            if hasattr(self.window, 'file_watcher') and self.window.file_watcher:
+            if self.window.file_watcher is not None:
                 self.window.file_watcher.remove_watch_paths([removed_folder])
             self.rescan_library()
 
@@ -599,91 +792,177 @@ class LibraryController:
         if not self.library:
             return
 
-        if hasattr(self.window, 'scan_overlay'):
-            self.window.scan_overlay.show_scanning("Scanning library folders...")
+        overlay = self.window._ensure_scan_overlay()
+        overlay.show_scanning("Scanning library folders...")
 
-        current_search = self.search_input.text() if hasattr(self, 'search_input') else ""
-        organize_by_folder = self.organize_by_folder_cb.isChecked() if hasattr(self, 'organize_by_folder_cb') else False
+        current_search = self.search_input.text() if self.search_input is not None else ""
+        organize_by_folder = self.organize_by_folder_cb.isChecked() if self.organize_by_folder_cb is not None else False
         if current_search:
             self.search_input.clear()
 
-        if hasattr(self.window, 'scan_overlay'):
-            def on_scan_progress(current, total, filename):
-                self.window.scan_overlay.update_progress(current, total, filename)
-                QApplication.processEvents()
-            self.library.set_progress_callback(on_scan_progress)
+        last_update = [0.0]
+
+        def on_scan_progress(current, total, filename):
+            now = time.monotonic()
+            if now - last_update[0] < _SCAN_PROGRESS_INTERVAL and current != total:
+                return
+            last_update[0] = now
+            overlay.update_progress(current, total, filename)
+            QApplication.processEvents()
+        self.library.set_progress_callback(on_scan_progress)
 
         try:
             self.library.scan_folders(self.window.config.library_folders, self.window.config.scan_subdirs, self.window.config.kh_rando_folder)
+            self._clear_index_for(self.file_list)
+            self.window.invalidate_full_playlist_cache()
             self._populate_kh_rando_list()
             self._update_kh_rando_section_counts()
-            self.folder_list.clear()
-            for folder in self.window.config.library_folders:
-                self.folder_list.addItem(folder)
+            with _frozen_list(self.folder_list):
+                self.folder_list.clear()
+                self.folder_list.addItems(self.window.config.library_folders)
+            # Selection signals were blocked during the refill
+            self.on_folder_selection_changed()
             self.subdirs_checkbox.setChecked(self.window.config.scan_subdirs)
             if organize_by_folder:
-                if hasattr(self, '_files_by_folder_cache'):
-                    self._files_by_folder_cache.clear()
+                self._files_by_folder_cache.clear()
                 self._organize_files_by_folder()
             if current_search:
                 self.search_input.setText(current_search)
                 self.filter_library_files()
         finally:
             self.library.set_progress_callback(None)
-            if hasattr(self.window, 'scan_overlay'):
-                self.window.scan_overlay.hide_scanning()
+            overlay.hide_scanning()
+
+    def _invalidate_filter(self, *args):
+        self._last_search_text = None
+        self._file_entries = None
+        self._visible_row_indices = None
+        self._collapsed_haystacks.clear()
+
+    def _get_file_entries(self):
+        """Return file_list rows as (item, path, is_header, haystack) tuples, in row order.
+
+        Built once from the widget and dropped whenever its model changes, so
+        repeated searches walk a Python list instead of asking Qt for every row.
+        A file's haystack is the one set_search_keys stored on the row (see
+        core.library.search_haystack); the folder name is part of the folder and
+        needs no field of its own. Header rows carry their lowercased folder name.
+        """
+        if self._file_entries is None:
+            entries = []
+            for i in range(self.file_list.count()):
+                item = self.file_list.item(i)
+                file_path = item.data(Qt.UserRole)
+                if item.data(FOLDER_HEADER_ROLE):
+                    folder_name = file_path.replace("FOLDER_HEADER:", "")
+                    entries.append((item, file_path, True, folder_name.lower()))
+                else:
+                    haystack = item.data(SEARCH_HAYSTACK_ROLE)
+                    if haystack is None:
+                        haystack = search_haystack(item.text(), file_path)
+                    entries.append((item, file_path, False, haystack))
+            self._file_entries = entries
+        return self._file_entries
+
+    def _on_search_text_changed(self, _text):
+        self._search_timer.start()
 
     def filter_library_files(self):
         search_text = self.search_input.text().lower()
-        if not search_text:
-            for i in range(self.file_list.count()):
-                item = self.file_list.item(i)
-                item.setHidden(False)
+        previous_text = self._last_search_text
+        if search_text == previous_text:
             return
+        self._last_search_text = search_text
+        entries = self._get_file_entries()
+        # Extending the query can only hide more rows, so rows hidden by the
+        # previous query stay hidden and only the visible ones are rechecked
+        if previous_text and search_text.startswith(previous_text) and self._visible_row_indices is not None:
+            rows = self._visible_row_indices
+        else:
+            rows = range(len(entries))
+        # Visibility flips are batched into a single repaint
+        self.file_list.setUpdatesEnabled(False)
+        try:
+            self._visible_row_indices = self._apply_search(entries, rows, search_text)
+        finally:
+            self.file_list.setUpdatesEnabled(True)
+
+    def _apply_search(self, entries, rows, search_text):
+        """Hide the given rows that don't match search_text, and headers left without matches.
+
+        Returns the indices of the rows left visible.
+        """
+        if not search_text:
+            for row in rows:
+                item = entries[row][0]
+                if item.isHidden():
+                    item.setHidden(False)
+            return list(rows)
+        visible = []
+
+        # Only rows whose visibility actually flips are touched
+        def set_hidden(item, hidden):
+            if item.isHidden() != hidden:
+                item.setHidden(hidden)
 
         is_folder_mode = self.organize_by_folder_cb.isChecked()
         if is_folder_mode:
-            current_folder = None
+            folder_name_matches = False
             folder_has_matches = False
             folder_header_item = None
-            for i in range(self.file_list.count()):
-                item = self.file_list.item(i)
-                file_path = item.data(Qt.UserRole)
-                if file_path and file_path.startswith("FOLDER_HEADER:"):
+            header_slot = None  # position of the current header in visible
+            for row in rows:
+                item, file_path, is_header, haystack = entries[row]
+                if is_header:
                     if folder_header_item is not None:
-                        folder_header_item.setHidden(not folder_has_matches)
+                        set_hidden(folder_header_item, not folder_has_matches)
+                        if not folder_has_matches:
+                            del visible[header_slot]
                     folder_header_item = item
-                    folder_has_matches = False
-                    current_folder = file_path.replace("FOLDER_HEADER:", "")
-                else:
-                    item_text = item.text().lower()
-                    folder_path = os.path.dirname(file_path).lower() if file_path else ""
-                    matches = (
-                        search_text in item_text
-                        or search_text in folder_path
-                        or search_text in os.path.basename(folder_path)
-                        or (current_folder and search_text in current_folder.lower())
+                    # A collapsed folder has no file rows; its cached files decide instead
+                    folder_name = file_path[len("FOLDER_HEADER:"):]
+                    folder_has_matches = (
+                        not self._folder_expanded_states.get(folder_name, True)
+                        and self._collapsed_folder_matches(folder_name, haystack, search_text)
                     )
-                    item.setHidden(not matches)
+                    # Tested once per header; every row under a matching folder matches
+                    folder_name_matches = search_text in haystack
+                    header_slot = len(visible)
+                    visible.append(row)
+                else:
+                    matches = folder_name_matches or search_text in haystack
+                    set_hidden(item, not matches)
                     if matches:
                         folder_has_matches = True
+                        visible.append(row)
             if folder_header_item is not None:
-                folder_header_item.setHidden(not folder_has_matches)
+                set_hidden(folder_header_item, not folder_has_matches)
+                if not folder_has_matches:
+                    del visible[header_slot]
         else:
-            for i in range(self.file_list.count()):
-                item = self.file_list.item(i)
-                file_path = item.data(Qt.UserRole)
-                item_text = item.text().lower()
-                folder_path = os.path.dirname(file_path).lower() if file_path else ""
-                matches = (
-                    search_text in item_text
-                    or search_text in folder_path
-                    or search_text in os.path.basename(folder_path)
-                )
-                item.setHidden(not matches)
+            for row in rows:
+                item, _, _, haystack = entries[row]
+                matches = search_text in haystack
+                set_hidden(item, not matches)
+                if matches:
+                    visible.append(row)
+        return visible
+
+    def _collapsed_folder_matches(self, folder_name, folder_lower, search_text):
+        """Whether search_text matches a collapsed folder's name or any file cached under it."""
+        if search_text in folder_lower:
+            return True
+        haystacks = self._collapsed_haystacks.get(folder_name)
+        if haystacks is None:
+            haystacks = self._collapsed_haystacks[folder_name] = [
+                search_haystack(text, file_path)
+                for text, file_path, _ in self._files_by_folder_cache.get(folder_name, ())
+            ]
+        return any(search_text in haystack for haystack in haystacks)
 
     def clear_search(self):
         self.search_input.clear()
+        self._search_timer.stop()
         self.filter_library_files()
 
     def toggle_folder_organization(self):
@@ -703,20 +982,21 @@ class LibraryController:
             self._folder_expanded_states[folder] = folder in expanded_folders
 
     def _add_file_to_folder_cache(self, file_path: str, display_text: str, color):
-        folder = os.path.dirname(file_path)
-        folder_name = os.path.basename(folder) if folder and folder != "." else "Files (No Folder)"
-        if folder_name not in self._files_by_folder_cache:
-            self._files_by_folder_cache[folder_name] = []
-        self._files_by_folder_cache[folder_name].append((display_text, file_path, color))
+        folder_name = _folder_group_name(file_path)
+        self._collapsed_haystacks.pop(folder_name, None)
+        # Buckets stay sorted by file name
+        _insort_folder_entry(self._files_by_folder_cache.setdefault(folder_name, []), (display_text, file_path, color))
 
     def _remove_file_from_folder_cache(self, file_path: str):
-        for folder_name in list(self._files_by_folder_cache.keys()):
-            self._files_by_folder_cache[folder_name] = [
-                (text, fpath, color) for text, fpath, color in self._files_by_folder_cache[folder_name]
-                if fpath != file_path
-            ]
-            if not self._files_by_folder_cache[folder_name]:
-                del self._files_by_folder_cache[folder_name]
+        # A file can only be cached under its own folder group
+        folder_name = _folder_group_name(file_path)
+        self._collapsed_haystacks.pop(folder_name, None)
+        entries = self._files_by_folder_cache.get(folder_name)
+        if entries is None:
+            return
+        entries[:] = [entry for entry in entries if entry[1] != file_path]
+        if not entries:
+            del self._files_by_folder_cache[folder_name]
 
     def _organize_files_by_folder(self):
         if not self.library:
@@ -732,52 +1012,65 @@ class LibraryController:
         if use_cache:
             files_by_folder = self._files_by_folder_cache.copy()
         else:
-            kh_rando_path_obj = None
-            if self.window.config.kh_rando_folder:
-                try:
-                    kh_rando_path_obj = Path(self.window.config.kh_rando_folder).resolve()
-                except Exception:
-                    kh_rando_path_obj = None
+            check_kh_rando = bool(self.window.config.kh_rando_folder)
+            group_names = {}  # directory -> folder group name, split once per directory
             for i in range(self.file_list.count()):
                 item = self.file_list.item(i)
                 file_path = item.data(Qt.UserRole)
                 if file_path and not file_path.startswith("FOLDER_HEADER"):
-                    if kh_rando_path_obj:
+                    if check_kh_rando:
                         try:
-                            if Path(file_path).resolve().is_relative_to(kh_rando_path_obj):
+                            if self._is_under_kh_rando(self._rp(file_path)):
                                 continue
                         except Exception:
                             pass
                     folder = os.path.dirname(file_path)
-                    folder_name = os.path.basename(folder) if folder and folder != "." else "Files (No Folder)"
-                    files_by_folder.setdefault(folder_name, []).append((item.text(), file_path, item.foreground()))
+                    group_name = group_names.get(folder)
+                    if group_name is None:
+                        group_name = group_names[folder] = _folder_group_name(file_path)
+                    files_by_folder.setdefault(group_name, []).append((item.text(), file_path, item.foreground()))
+            # Sorted once here so readers can walk each bucket in display order
+            for entries in files_by_folder.values():
+                entries.sort(key=_folder_entry_key)
             self._files_by_folder_cache = files_by_folder
 
-        self.file_list.clear()
-        if not self._folder_expanded_states:
-            self._folder_expanded_states = {}
-
-        for folder_name in sorted(files_by_folder.keys()):
-            if folder_name not in self._folder_expanded_states:
-                self._folder_expanded_states[folder_name] = True
-            is_expanded = self._folder_expanded_states[folder_name]
-            arrow = "▼" if is_expanded else "▶"
-            file_count = len(files_by_folder[folder_name])
-            header_item = QListWidgetItem(f"{arrow} 📁 {folder_name} ({file_count})")
-            header_item.setData(Qt.UserRole, f"FOLDER_HEADER:{folder_name}")
-            header_item.setForeground(QColor('lightblue'))
-            header_item.setFlags(header_item.flags() | Qt.ItemIsSelectable)
-            self.file_list.addItem(header_item)
-
-            if is_expanded:
-                sorted_files = sorted(files_by_folder[folder_name], key=lambda x: os.path.basename(x[1]).lower())
-                for file_text, file_path, file_color in sorted_files:
-                    clean_text = file_text.lstrip()
-                    file_item = QListWidgetItem(f"    {clean_text}")
-                    file_item.setData(Qt.UserRole, file_path)
-                    if file_color:
-                        file_item.setForeground(file_color)
-                    self.file_list.addItem(file_item)
+        had_selection = bool(self.file_list.selectedItems())
+        with _frozen_list(self.file_list):
+            self.file_list.clear()
+            self._clear_index_for(self.file_list)
+            self.library.file_list_index.clear()
+            self.window.invalidate_full_playlist_cache()
+            self._folder_header_items = {}
+            self._folder_order = []
+
+            for folder_name in sorted(files_by_folder.keys()):
+                if folder_name not in self._folder_expanded_states:
+                    self._folder_expanded_states[folder_name] = True
+                is_expanded = self._folder_expanded_states[folder_name]
+                arrow = "▼" if is_expanded else "▶"
+                file_count = len(files_by_folder[folder_name])
+                header_item = QListWidgetItem(f"{arrow} 📁 {folder_name} ({file_count})")
+                header_item.setData(Qt.UserRole, f"FOLDER_HEADER:{folder_name}")
+                header_item.setData(FOLDER_HEADER_ROLE, True)
+                header_item.setForeground(QColor('lightblue'))
+                header_item.setFlags(header_item.flags() | Qt.ItemIsSelectable)
+                self.file_list.addItem(header_item)
+                self._folder_order.append(folder_name)
+                self._folder_header_items[folder_name] = header_item
+
+                if is_expanded:
+                    for file_text, file_path, file_color in files_by_folder[folder_name]:
+                        clean_text = file_text.lstrip()
+                        file_item = QListWidgetItem(f"    {clean_text}")
+                        file_item.setData(Qt.UserRole, file_path)
+                        set_search_keys(file_item, file_path)
+                        if file_color:
+                            file_item.setForeground(file_color)
+                        self.file_list.addItem(file_item)
+                        self._index_item(self.file_list, file_item, file_path)
+        if had_selection:
+            # Selection signals were blocked while rebuilding; report the cleared selection once
+            self.on_library_selection_changed()
 
         if current_search:
             self.search_input.setText(current_search)
@@ -787,12 +1080,11 @@ class LibraryController:
 
     # Item click handling
     def on_kh_rando_item_clicked(self, item):
-        file_path = item.data(Qt.UserRole)
-        if file_path and file_path.startswith("KH_CATEGORY_HEADER:"):
-            category_key = file_path.replace("KH_CATEGORY_HEADER:", "")
-            self._toggle_kh_category_expansion(category_key)
+        if item.data(KH_HEADER_ROLE):
+            self._toggle_kh_category_expansion(item.data(KH_CATEGORY_ROLE))
             return
-        if file_path and not file_path.startswith("KH_CATEGORY_HEADER:"):
+        file_path = item.data(Qt.UserRole)
+        if file_path:
             self._updating_selection = True
             self.file_list.clearSelection()
             self._updating_selection = False
@@ -830,15 +1122,46 @@ class LibraryController:
                 self.library.kh_rando_categories = self.kh_rando_categories
 
     def _update_kh_rando_section_counts(self):
-        if hasattr(self, 'kh_rando_file_list'):
+        if self.kh_rando_file_list is not None:
             self._populate_kh_rando_list()
             QApplication.processEvents()
 
-    def _refresh_duplicate_status(self):
+    def _refresh_duplicate_status(self, category=None, paths=None, before=None):
+        """Recompute KH Rando duplicate badges.
+
+        With a category, only that folder is rescanned and only rows whose base name
+        entered or left it are rewritten; other rows keep their current status.
+        before gives the category's file names to compare against when the
+        exporter's cache already includes the change (as it does after an export).
+        With paths, the caller has already refreshed the exporter and only library
+        rows sharing a base name with one of those files are rewritten.
+        """
         exporter = getattr(self.window, 'kh_rando_exporter', None)
         if not exporter:
             return
-        exporter.refresh_existing_files()
+        changed = None
+        if paths is not None:
+            changed = {os.path.splitext(os.path.basename(p))[0].lower() for p in paths}
+            if not changed or not self.library:
+                return
+            for file_path, item in list(self.library.file_list_index.items()):
+                if os.path.splitext(os.path.basename(file_path))[0].lower() not in changed:
+                    continue
+                if sip.isdeleted(item) or item.listWidget() is not self.file_list:
+                    continue
+                self._update_item_duplicate_status(exporter, item, file_path)
+            return
+        if category is None:
+            exporter.refresh_existing_files()
+        else:
+            if before is None:
+                before = exporter.existing_files.get(category, ())
+            before = {os.path.splitext(f)[0] for f in before}
+            exporter.refresh_category_files(category)
+            after = {os.path.splitext(f)[0] for f in exporter.existing_files.get(category, ())}
+            changed = before ^ after
+            if not changed:
+                return
         for i in range(self.file_list.count()):
             item = self.file_list.item(i)
             if not item:
@@ -846,28 +1169,36 @@ class LibraryController:
             file_path = item.data(Qt.UserRole)
             if not file_path or file_path.startswith("FOLDER_HEADER:"):
                 continue
-            filename = os.path.basename(file_path)
-            kh_categories = exporter.is_file_in_kh_rando(filename)
-            kh_status = ""
-            if kh_categories:
-                if kh_categories == ['root']:
-                    kh_status = " [KH: root folder - misplaced]"
-                else:
-                    display_categories = [cat for cat in kh_categories if cat != 'root']
-                    if display_categories:
-                        kh_status = f" [KH: {', '.join(display_categories)} - duplicate]"
-            try:
+            if changed is not None and os.path.splitext(os.path.basename(file_path))[0].lower() not in changed:
+                continue
+            self._update_item_duplicate_status(exporter, item, file_path)
+
+    def _update_item_duplicate_status(self, exporter, item, file_path):
+        """Rewrite one library row's text and colour from its current KH Rando duplicate status."""
+        filename = os.path.basename(file_path)
+        kh_categories = exporter.is_file_in_kh_rando(filename)
+        kh_status = ""
+        if kh_categories:
+            if kh_categories == ['root']:
+                kh_status = " [KH: root folder - misplaced]"
+            else:
+                display_categories = [cat for cat in kh_categories if cat != 'root']
+                if display_categories:
+                    kh_status = f" [KH: {', '.join(display_categories)} - duplicate]"
+        try:
+            size = self.library.file_sizes.get(file_path) if self.library else None
+            if size is None:
                 size = os.path.getsize(file_path)
-                from utils.helpers import format_file_size
-                size_str = format_file_size(size)
-            except Exception:
-                size_str = "? MB"
-            display_text = f"{filename} ({size_str}){kh_status}"
-            current_text = item.text()
-            if current_text.startswith("    "):
-                display_text = f"    {display_text}"
-            item.setText(display_text)
-            item.setForeground(QColor('orange') if kh_status else QColor('white'))
+            size_str = format_file_size(size)
+        except Exception:
+            size_str = "? MB"
+        display_text = f"{filename} ({size_str}){kh_status}"
+        current_text = item.text()
+        if current_text.startswith("    "):
+            display_text = f"    {display_text}"
+        item.setText(display_text)
+        set_search_keys(item, file_path)
+        item.setForeground(QColor('orange') if kh_status else QColor('white'))
 
     def _select_files_in_folder(self, folder_name):
         self.file_list.clearSelection()
@@ -886,15 +1217,59 @@ class LibraryController:
     def _toggle_kh_category_expansion(self, category_key):
         if category_key not in self.kh_rando_category_states:
             return
-        current_state = self.kh_rando_category_states[category_key]
-        self.kh_rando_category_states[category_key] = not current_state
-        self._populate_kh_rando_list()
-        if getattr(self.window, 'current_file', None):
+        new_state = not self.kh_rando_category_states[category_key]
+        self.kh_rando_category_states[category_key] = new_state
+        header_item = self._kh_category_headers.get(category_key)
+        if (header_item is None or sip.isdeleted(header_item)
+                or header_item.listWidget() is not self.kh_rando_file_list):
+            self._populate_kh_rando_list()
+            return
+        # Only the toggled category's rows are created or removed; the rest of the list is untouched
+        files_by_category = getattr(self.library, 'kh_rando_files_by_category', {}) or {}
+        category_files = files_by_category.get(category_key, [])
+        header_item.setText(self._kh_category_header_text(category_key, new_state, len(category_files)))
+        header_row = self.kh_rando_file_list.row(header_item)
+        self.kh_rando_file_list.setUpdatesEnabled(False)
+        try:
+            if new_state:
+                insert_position = header_row + 1
+                for file_path, display_name in category_files:
+                    file_item = self._make_kh_file_item(category_key, file_path, display_name)
+                    self.kh_rando_file_list.insertItem(insert_position, file_item)
+                    self._index_item(self.kh_rando_file_list, file_item, file_path)
+                    insert_position += 1
+            else:
+                end_row = self._next_kh_category_header_row(category_key)
+                for i in range(end_row - 1, header_row, -1):
+                    item = self.kh_rando_file_list.takeItem(i)
+                    if item is not None:
+                        self._unindex_item(item, item.data(Qt.UserRole))
+        finally:
+            self.kh_rando_file_list.setUpdatesEnabled(True)
+        if new_state and getattr(self.window, 'current_file', None):
             self.update_library_selection(self.window.current_file)
 
+    def _kh_category_header_text(self, category_key, is_expanded, file_count):
+        arrow = "▼" if is_expanded else "▶"
+        return f"{arrow} 📁 {self.kh_rando_categories.get(category_key, category_key)} ({file_count})"
+
+    def _make_kh_file_item(self, category_key, file_path, display_name):
+        file_item = QListWidgetItem(f"    {display_name}")
+        file_item.setData(Qt.UserRole, file_path)
+        file_item.setData(KH_CATEGORY_ROLE, category_key)
+        return file_item
+
+    def _next_kh_category_header_row(self, category_key):
+        """Row of the header following category_key's, or the row count if it is the last category."""
+        keys = list(self._kh_category_headers)
+        position = keys.index(category_key)
+        if position + 1 >= len(keys):
+            return self.kh_rando_file_list.count()
+        return self.kh_rando_file_list.row(self._kh_category_headers[keys[position + 1]])
+
     def add_kh_rando_folder(self):
         kh_rando_folder = self.window.config.kh_rando_folder
-        if not kh_rando_folder or not os.path.exists(kh_rando_folder):
+        if not kh_rando_folder or not self._exists(kh_rando_folder):
             QMessageBox.warning(
                 self.window,
                 "No KH Rando Directory",
@@ -913,7 +1288,7 @@ class LibraryController:
             if not folder_name:
                 return
             new_folder_path = os.path.join(kh_rando_folder, folder_name)
-            if os.path.exists(new_folder_path):
+            if self._exists(new_folder_path):
                 QMessageBox.warning(
                     self.window,
                     "Folder Exists",
@@ -922,6 +1297,7 @@ class LibraryController:
                 return
             try:
                 os.makedirs(new_folder_path)
+                self._invalidate_exists(new_folder_path)
                 logging.info(f"Created new KH Rando folder: {new_folder_path}")
                 if self.library:
                     self.library.scan_folders(
@@ -929,6 +1305,8 @@ class LibraryController:
                         self.window.config.scan_subdirs,
                         self.window.config.kh_rando_folder,
                     )
+                    self._clear_index_for(self.file_list)
+                    self.window.invalidate_full_playlist_cache()
                     self._update_kh_rando_categories()
                     self._populate_kh_rando_list()
                 QMessageBox.information(
@@ -945,35 +1323,44 @@ class LibraryController:
                 logging.error(f"Failed to create KH Rando folder: {e}")
 
     def _populate_kh_rando_list(self):
-        if not hasattr(self, 'kh_rando_file_list') or not self.library:
+        if self.kh_rando_file_list is None or not self.library:
             return
         selected_paths = []
         for item in self.kh_rando_file_list.selectedItems():
             path = item.data(Qt.UserRole)
             if path and not path.startswith("KH_CATEGORY_HEADER:"):
                 selected_paths.append(path)
-        self.kh_rando_file_list.clear()
-        files_by_category = getattr(self.library, 'kh_rando_files_by_category', {}) or {}
-        for category_key, category_name in self.kh_rando_categories.items():
-            is_expanded = self.kh_rando_category_states.get(category_key, True)
-            category_files = files_by_category.get(category_key, [])
-            file_count = len(category_files)
-            arrow = "▼" if is_expanded else "▶"
-            header_item = QListWidgetItem(f"{arrow} 📁 {category_name} ({file_count})")
-            header_item.setData(Qt.UserRole, f"KH_CATEGORY_HEADER:{category_key}")
-            header_item.setForeground(QColor('lightblue'))
-            header_item.setFlags(header_item.flags() | Qt.ItemIsSelectable)
-            self.kh_rando_file_list.addItem(header_item)
-            if is_expanded and category_files:
-                for file_path, display_name in sorted(category_files):
-                    file_item = QListWidgetItem(f"    {display_name}")
-                    file_item.setData(Qt.UserRole, file_path)
-                    self.kh_rando_file_list.addItem(file_item)
+        with _frozen_list(self.kh_rando_file_list):
+            self.kh_rando_file_list.clear()
+            self._clear_index_for(self.kh_rando_file_list)
+            self._kh_category_headers = {}
+            files_by_category = getattr(self.library, 'kh_rando_files_by_category', {}) or {}
+            for category_key in self.kh_rando_categories:
+                is_expanded = self.kh_rando_category_states.get(category_key, True)
+                category_files = files_by_category.get(category_key, [])
+                header_item = QListWidgetItem(
+                    self._kh_category_header_text(category_key, is_expanded, len(category_files))
+                )
+                header_item.setData(Qt.UserRole, f"KH_CATEGORY_HEADER:{category_key}")
+                header_item.setData(KH_CATEGORY_ROLE, category_key)
+                header_item.setData(KH_HEADER_ROLE, True)
+                header_item.setForeground(QColor('lightblue'))
+                header_item.setFlags(header_item.flags() | Qt.ItemIsSelectable)
+                self.kh_rando_file_list.addItem(header_item)
+                self._kh_category_headers[category_key] = header_item
+                if is_expanded and category_files:
+                    for file_path, display_name in category_files:
+                        file_item = self._make_kh_file_item(category_key, file_path, display_name)
+                        self.kh_rando_file_list.addItem(file_item)
+                        self._index_item(self.kh_rando_file_list, file_item, file_path)
+            if selected_paths:
+                for i in range(self.kh_rando_file_list.count()):
+                    item = self.kh_rando_file_list.item(i)
+                    if item.data(Qt.UserRole) in selected_paths:
+                        item.setSelected(True)
         if selected_paths:
-            for i in range(self.kh_rando_file_list.count()):
-                item = self.kh_rando_file_list.item(i)
-                if item.data(Qt.UserRole) in selected_paths:
-                    item.setSelected(True)
+            # Selection signals were blocked while rebuilding; report the restored selection once
+            self.on_kh_rando_selection_changed()
         if getattr(self.window, 'current_file', None):
             self.update_library_selection(self.window.current_file)
 
@@ -981,75 +1368,215 @@ class LibraryController:
         current_state = self._folder_expanded_states.get(folder_name, True)
         self._folder_expanded_states[folder_name] = not current_state
         new_state = not current_state
-        folder_header_item = None
-        folder_header_index = -1
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            file_path = item.data(Qt.UserRole)
-            if file_path == f"FOLDER_HEADER:{folder_name}":
-                folder_header_item = item
-                folder_header_index = i
-                break
+        folder_header_item = self._live_folder_header(folder_name)
         if folder_header_item is None:
             return
+        folder_header_index = self.file_list.row(folder_header_item)
         arrow = "▼" if new_state else "▶"
         current_text = folder_header_item.text()
         if "(" in current_text and ")" in current_text:
             file_count_part = current_text[current_text.rfind("("):]
             folder_header_item.setText(f"{arrow} 📁 {folder_name} {file_count_part}")
-        if new_state:
-            if folder_name in self._files_by_folder_cache:
-                files_to_add = self._files_by_folder_cache[folder_name]
-                insert_position = folder_header_index + 1
-                for file_text, file_path, file_color in sorted(files_to_add):
-                    file_item = QListWidgetItem(f"    {file_text}")
-                    file_item.setData(Qt.UserRole, file_path)
-                    if file_color:
-                        file_item.setForeground(file_color)
-                    self.file_list.insertItem(insert_position, file_item)
-                    insert_position += 1
-            if getattr(self.window, 'current_file', None):
-                self.update_library_selection(self.window.current_file)
-        else:
-            items_to_remove = []
-            for i in range(folder_header_index + 1, self.file_list.count()):
-                item = self.file_list.item(i)
-                file_path = item.data(Qt.UserRole)
-                if file_path and file_path.startswith("FOLDER_HEADER:"):
-                    break
-                items_to_remove.append(i)
-            for i in reversed(items_to_remove):
-                self.file_list.takeItem(i)
+        # Rows are inserted or taken one at a time, so repaint once at the end
+        self.file_list.setUpdatesEnabled(False)
+        try:
+            if new_state:
+                if folder_name in self._files_by_folder_cache:
+                    files_to_add = self._files_by_folder_cache[folder_name]
+                    insert_position = folder_header_index + 1
+                    for file_text, file_path, file_color in files_to_add:
+                        file_item = QListWidgetItem(f"    {file_text}")
+                        file_item.setData(Qt.UserRole, file_path)
+                        set_search_keys(file_item, file_path)
+                        if file_color:
+                            file_item.setForeground(file_color)
+                        self.file_list.insertItem(insert_position, file_item)
+                        self._index_item(self.file_list, file_item, file_path)
+                        insert_position += 1
+            else:
+                # Children run up to the next folder's header, so the range is known
+                # without walking the rows in between
+                end_row = self._next_folder_header_row(folder_name)
+                for i in range(end_row - 1, folder_header_index, -1):
+                    item = self.file_list.takeItem(i)
+                    if item is not None:
+                        self._unindex_item(item, item.data(Qt.UserRole))
+        finally:
+            self.file_list.setUpdatesEnabled(True)
+        # Re-inserted rows start visible; hide the ones the active search excludes
+        if new_state and self.search_input is not None and self.search_input.text():
+            self.filter_library_files()
+        if new_state and getattr(self.window, 'current_file', None):
+            self.update_library_selection(self.window.current_file)
 
-    def update_library_selection(self, file_path):
+    def _live_folder_header(self, folder_name):
+        """Return the header item for folder_name, rebuilding the header index if it is stale."""
+        header = self._folder_header_items.get(folder_name)
+        if header is not None and not sip.isdeleted(header) and header.listWidget() is self.file_list:
+            return header
+        self._folder_header_items = {}
+        self._folder_order = []
+        header = None
+        for i in range(self.file_list.count()):
+            item = self.file_list.item(i)
+            data = item.data(Qt.UserRole)
+            if data and data.startswith("FOLDER_HEADER:"):
+                name = data[len("FOLDER_HEADER:"):]
+                self._folder_order.append(name)
+                self._folder_header_items[name] = item
+                if name == folder_name:
+                    header = item
+        return header
+
+    def _next_folder_header_row(self, folder_name):
+        """Row of the header following folder_name's, or the row count if it is the last folder."""
         try:
-            from ui.mini_bar_visualizer import MiniBarVisualizer
-        except ImportError:
+            position = self._folder_order.index(folder_name)
+        except ValueError:
+            return self.file_list.count()
+        if position + 1 >= len(self._folder_order):
+            return self.file_list.count()
+        next_header = self._live_folder_header(self._folder_order[position + 1])
+        return self.file_list.row(next_header) if next_header is not None else self.file_list.count()
+
+    # Path -> row index
+    def _index_item(self, list_widget, item, file_path):
+        self._path_to_item.setdefault(file_path, []).append((list_widget, item))
+        if self.library and list_widget is self.file_list:
+            self.library.file_list_index[file_path] = item
+
+    def _unindex_item(self, item, file_path):
+        if self.library and self.library.file_list_index.get(file_path) is item:
+            del self.library.file_list_index[file_path]
+        entries = self._path_to_item.get(file_path)
+        if not entries:
             return
-
-        def update_list_widget(list_widget):
-            for i in range(list_widget.count()):
-                item = list_widget.item(i)
-                widget = list_widget.itemWidget(item)
-                if widget and widget.objectName() == "mini_bar_visualizer":
-                    list_widget.removeItemWidget(item)
+        entries[:] = [(lw, it) for lw, it in entries if it is not item]
+        if not entries:
+            del self._path_to_item[file_path]
+
+    def _clear_index_for(self, list_widget):
+        for file_path in list(self._path_to_item.keys()):
+            entries = [(lw, it) for lw, it in self._path_to_item[file_path] if lw is not list_widget]
+            if entries:
+                self._path_to_item[file_path] = entries
+            else:
+                del self._path_to_item[file_path]
+
+    def _find_item_for_path(self, file_path):
+        """Return (list_widget, item) showing file_path, or None if it isn't visible."""
+        for list_widget, item in self._path_to_item.get(file_path, ()):
+            if not sip.isdeleted(item) and item.listWidget() is list_widget:
+                return list_widget, item
+        found = self._scan_items_for_path(file_path)
+        return found[0] if found else None
+
+    def _find_items_for_path(self, file_path):
+        """Return every (list_widget, item) row showing file_path."""
+        found = [
+            (list_widget, item) for list_widget, item in self._path_to_item.get(file_path, ())
+            if not sip.isdeleted(item) and item.listWidget() is list_widget
+        ]
+        return found or self._scan_items_for_path(file_path)
+
+    def _scan_items_for_path(self, file_path):
+        # Rows added outside the indexed paths (e.g. by AudioLibrary directly):
+        # fall back to a scan and remember what we find
+        self._path_to_item.pop(file_path, None)
+        found = []
+        for list_widget in (self.file_list, self.kh_rando_file_list):
+            if list_widget is None:
+                continue
             for i in range(list_widget.count()):
                 item = list_widget.item(i)
-                if item and item.data(Qt.UserRole) == file_path:
-                    visualizer = MiniBarVisualizer(list_widget)
-                    visualizer.setObjectName("mini_bar_visualizer")
-                    list_widget.setItemWidget(item, visualizer)
-                    break
+                if item.data(Qt.UserRole) == file_path:
+                    self._index_item(list_widget, item, file_path)
+                    found.append((list_widget, item))
+        return found
+
+    def _get_mini_visualizer(self):
+        """Return the shared now-playing indicator, creating it on first use."""
+        visualizer = self._shared_mini_visualizer
+        if visualizer is None or sip.isdeleted(visualizer):
+            from ui.mini_bar_visualizer import MiniBarVisualizer
+            visualizer = MiniBarVisualizer(self.window)
+            visualizer.setObjectName("mini_bar_visualizer")
+            visualizer.hide()
+            visualizer.destroyed.connect(self._on_mini_visualizer_destroyed)
+            self._shared_mini_visualizer = visualizer
+        return visualizer
+
+    def _on_mini_visualizer_destroyed(self, obj=None):
+        # Rows that go away take their item widget, and the indicator inside it, with
+        # them; drop the reference and re-attach a fresh indicator to the playing row
+        self._shared_mini_visualizer = None
+        if getattr(self.window, 'current_file', None):
+            QTimer.singleShot(0, lambda: self.update_library_selection(self.window.current_file))
+
+    @staticmethod
+    def _row_holds_visualizer(list_widget, item, visualizer):
+        holder = list_widget.itemWidget(item)
+        return holder is not None and visualizer.parentWidget() is holder
+
+    def _attach_mini_visualizer(self, list_widget, item, visualizer):
+        # The view deletes a row's item widget on removeItemWidget, so the indicator
+        # sits in a throwaway holder it can be lifted out of and reused
+        holder = QWidget()
+        holder.setFixedSize(visualizer.size())
+        layout = QHBoxLayout(holder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(visualizer)
+        visualizer.show()
+        list_widget.setItemWidget(item, holder)
+
+    def _detach_mini_visualizer(self, list_widget, item, visualizer):
+        visualizer.hide()
+        visualizer.setParent(self.window)
+        list_widget.removeItemWidget(item)
+
+    def _visualizer_is_current(self, file_path):
+        """True if the indicator is already attached to the row for file_path."""
+        item = self._current_visualizer_item
+        visualizer = self._shared_mini_visualizer
+        if file_path != self._current_visualizer_file or item is None or visualizer is None:
+            return False
+        if sip.isdeleted(item) or sip.isdeleted(visualizer):
+            return False
+        list_widget = item.listWidget()
+        return list_widget is not None and self._row_holds_visualizer(list_widget, item, visualizer)
 
-        update_list_widget(self.file_list)
-        if hasattr(self, 'kh_rando_file_list') and self.kh_rando_file_list:
-            update_list_widget(self.kh_rando_file_list)
+    def update_library_selection(self, file_path):
+        if self._visualizer_is_current(file_path):
+            return
+        try:
+            visualizer = self._get_mini_visualizer()
+        except ImportError:
+            return
+
+        previous = self._current_visualizer_item
+        if previous is not None and not sip.isdeleted(previous):
+            previous_list = previous.listWidget()
+            if previous_list is not None and self._row_holds_visualizer(previous_list, previous, visualizer):
+                if previous.data(Qt.UserRole) != file_path:
+                    self._detach_mini_visualizer(previous_list, previous, visualizer)
+
+        target = self._find_item_for_path(file_path)
+        if target is None:
+            visualizer.hide()
+            self._current_visualizer_file = None
+            self._current_visualizer_item = None
+            return
+        list_widget, item = target
+        if not self._row_holds_visualizer(list_widget, item, visualizer):
+            self._attach_mini_visualizer(list_widget, item, visualizer)
+        self._current_visualizer_file = file_path
+        self._current_visualizer_item = item
 
     def on_library_selection_changed(self):
         if self._updating_selection:
             return
         selected_items = self.file_list.selectedItems()
-        if selected_items and hasattr(self, 'kh_rando_file_list'):
+        if selected_items and self.kh_rando_file_list is not None:
             self._updating_selection = True
             self.kh_rando_file_list.clearSelection()
             self._updating_selection = False
@@ -1067,21 +1594,21 @@ class LibraryController:
             for item in selected_items:
                 file_path = item.data(Qt.UserRole)
                 if file_path:
-                    ext = file_path.lower()
-                    if not ext.endswith('.wav'):
+                    ext = _item_ext(item, file_path)
+                    if ext != '.wav':
                         has_non_wav_files = True
-                    if not ext.endswith('.scd'):
+                    if ext != '.scd':
                         has_non_scd_files = True
-                    if single_selection and (ext.endswith('.scd') or ext.endswith('.wav')):
+                    if single_selection and ext in _LOOP_EDITOR_EXTS:
                         single_supported_selection = True
         else:
             if self.window.current_file and os.path.exists(self.window.current_file):
-                ext = self.window.current_file.lower()
-                if not ext.endswith('.wav'):
+                ext = os.path.splitext(self.window.current_file)[1].lower()
+                if ext != '.wav':
                     has_non_wav_files = True
-                if not ext.endswith('.scd'):
+                if ext != '.scd':
                     has_non_scd_files = True
-                if ext.endswith('.scd') or ext.endswith('.wav'):
+                if ext in _LOOP_EDITOR_EXTS:
                     single_supported_selection = True
 
         self.export_selected_btn.setEnabled(has_selection)
@@ -1096,7 +1623,7 @@ class LibraryController:
     def get_all_selected_items(self):
         selected_items = []
         selected_items.extend(self.file_list.selectedItems())
-        if hasattr(self, 'kh_rando_file_list'):
+        if self.kh_rando_file_list is not None:
             for item in self.kh_rando_file_list.selectedItems():
                 file_path = item.data(Qt.UserRole)
                 if file_path and not file_path.startswith("KH_CATEGORY_HEADER:"):
@@ -1109,10 +1636,11 @@ class LibraryController:
             show_themed_message(self.window, QMessageBox.Information, "No Selection", "Please select one or more files to delete.")
             return
 
+        # Check existence once up front; the delete loop below doesn't re-probe
         files_to_delete = []
         for item in selected_items:
             file_path = item.data(Qt.UserRole)
-            if file_path and os.path.exists(file_path):
+            if file_path and self._exists(file_path):
                 files_to_delete.append(file_path)
 
         if not files_to_delete:
@@ -1133,9 +1661,11 @@ class LibraryController:
 
         deleted_count = 0
         failed_files = []
-        for file_path in files_to_delete:
-            if send_to_recycle_bin(file_path):
+        results = send_files_to_recycle_bin(files_to_delete)
+        for file_path, deleted in zip(files_to_delete, results):
+            if deleted:
                 deleted_count += 1
+                self._invalidate_exists(file_path)
             else:
                 failed_files.append(os.path.basename(file_path))
 
@@ -1163,7 +1693,7 @@ class LibraryController:
                         if os.path.basename(folder) == folder_name or folder == folder_name:
                             folder_path = folder
                             break
-                    if folder_path and os.path.exists(folder_path):
+                    if folder_path and self._exists(folder_path):
                         file_path = folder_path
                         source_description = "selected folder"
                     else:
@@ -1171,7 +1701,7 @@ class LibraryController:
                         return
                 elif data.startswith("KH_CATEGORY_HEADER:"):
                     kh_rando_folder = getattr(self.window.config, 'kh_rando_folder', None)
-                    if kh_rando_folder and os.path.exists(kh_rando_folder):
+                    if kh_rando_folder and self._exists(kh_rando_folder):
                         file_path = kh_rando_folder
                         source_description = "KH Rando folder"
                     else:
@@ -1192,7 +1722,7 @@ class LibraryController:
                               "Please select a file from the library or load a file to play first.")
             return
 
-        if not file_path or not os.path.exists(file_path):
+        if not file_path or not self._exists(file_path):
             show_themed_message(self.window, QMessageBox.Warning, "File Not Found",
                               f"The {source_description} no longer exists on disk.")
             return
@@ -1316,65 +1846,90 @@ class LibraryController:
 
     def convert_selected_to_wav(self):
         """Convert selected library items (or current file) to WAV via the main conversion manager."""
-        if hasattr(self.window, 'conversion_manager'):
+        if self.window.conversion_manager is not None:
             self.window.conversion_manager.convert_selected_to_wav()
 
     def convert_selected_to_scd(self):
         """Convert selected library items (or current file) to SCD via the main conversion manager."""
-        if hasattr(self.window, 'conversion_manager'):
+        if self.window.conversion_manager is not None:
             self.window.conversion_manager.convert_selected_to_scd()
 
     def export_selected_to_kh_rando(self):
         """Delegate export of selected items to the KH Rando manager."""
-        if hasattr(self.window, 'kh_rando_manager'):
+        if self.window.kh_rando_manager is not None:
             self.window.kh_rando_manager.export_selected_to_kh_rando()
 
     def export_missing_to_kh_rando(self):
         """Delegate export of missing items to the KH Rando manager."""
-        if hasattr(self.window, 'kh_rando_manager'):
+        if self.window.kh_rando_manager is not None:
             self.window.kh_rando_manager.export_missing_to_kh_rando()
 
     # Context menus
+    def _build_file_list_menu(self):
+        menu = QMenu(self.window)
+        actions = {}
+        actions['export'] = menu.addAction("Export to KH Rando")
+        actions['export'].triggered.connect(self.export_selected_to_kh_rando)
+        menu.addSeparator()
+
+        actions['loop_editor'] = menu.addAction("Open Loop Editor")
+        actions['loop_editor'].triggered.connect(self.window.open_loop_editor)
+        actions['loop_editor_sep'] = menu.addSeparator()
+
+        actions['normalize'] = menu.addAction("Normalize...")
+        actions['normalize'].triggered.connect(lambda: self.open_normalize_dialog_for_paths([self._context_menu_path]))
+        actions['normalize_sep'] = menu.addSeparator()
+        send_menu = menu.addMenu("Send to KH2")
+        send_field_action = send_menu.addAction("Field Music")
+        send_field_action.triggered.connect(lambda: self.send_to_kh2(self._context_menu_path, 'field'))
+        send_battle_action = send_menu.addAction("Battle Music")
+        send_battle_action.triggered.connect(lambda: self.send_to_kh2(self._context_menu_path, 'battle'))
+        send_both_action = send_menu.addAction("Both (Field & Battle)")
+        send_both_action.triggered.connect(lambda: self.send_to_kh2(self._context_menu_path, 'both'))
+        actions['send'] = send_menu.menuAction()
+        actions['send_sep'] = menu.addSeparator()
+
+        actions['rename'] = menu.addAction("Rename")
+        actions['rename'].triggered.connect(lambda: self.rename_file(self._context_menu_path))
+        actions['delete'] = menu.addAction("Delete")
+        actions['delete'].triggered.connect(self.delete_selected_files)
+        return menu, actions
+
+    def _build_kh_rando_menu(self):
+        menu = QMenu(self.window)
+        actions = {}
+        actions['loop_editor'] = menu.addAction("Open Loop Editor")
+        actions['loop_editor'].triggered.connect(self.window.open_loop_editor)
+        actions['loop_editor_sep'] = menu.addSeparator()
+        actions['rename'] = menu.addAction("Rename")
+        actions['rename'].triggered.connect(lambda: self.rename_file(self._context_menu_path))
+        actions['delete'] = menu.addAction("Delete")
+        actions['delete'].triggered.connect(self.delete_selected_files)
+        return menu, actions
+
     def show_file_list_context_menu(self, position):
         item = self.file_list.itemAt(position)
         if not item:
             return
         file_path = item.data(Qt.UserRole)
-        if not file_path or file_path.startswith("FOLDER_HEADER"):
+        if not file_path or item.data(FOLDER_HEADER_ROLE):
             return
-        menu = QMenu(self.window)
-        export_action = menu.addAction("Export to KH Rando")
-        export_action.triggered.connect(self.export_selected_to_kh_rando)
-        menu.addSeparator()
-
-        selected_items = [item for item in self.file_list.selectedItems()
-                         if item.data(Qt.UserRole) and not item.data(Qt.UserRole).startswith("FOLDER_HEADER")]
-        if len(selected_items) == 1:
-            file_ext = os.path.splitext(file_path)[1].lower()
-            if file_ext in ['.scd', '.wav']:
-                loop_editor_action = menu.addAction("Open Loop Editor")
-                loop_editor_action.triggered.connect(self.window.open_loop_editor)
-                menu.addSeparator()
-
-            if file_ext == '.scd':
-                normalize_action = menu.addAction("Normalize...")
-                normalize_action.triggered.connect(lambda: self.open_normalize_dialog_for_paths([file_path]))
-                
-                menu.addSeparator()
-                send_menu = menu.addMenu("Send to KH2")
-                send_field_action = send_menu.addAction("Field Music")
-                send_field_action.triggered.connect(lambda: self.send_to_kh2(file_path, 'field'))
-                send_battle_action = send_menu.addAction("Battle Music")
-                send_battle_action.triggered.connect(lambda: self.send_to_kh2(file_path, 'battle'))
-                send_both_action = send_menu.addAction("Both (Field & Battle)")
-                send_both_action.triggered.connect(lambda: self.send_to_kh2(file_path, 'both'))
-                
-                menu.addSeparator()
-            rename_action = menu.addAction("Rename")
-            rename_action.triggered.connect(lambda: self.rename_file(file_path))
-        delete_action = menu.addAction("Delete")
-        delete_action.triggered.connect(self.delete_selected_files)
-        menu.exec_(self.file_list.mapToGlobal(position))
+        if self._file_list_menu is None:
+            self._file_list_menu, self._file_list_actions = self._build_file_list_menu()
+        actions = self._file_list_actions
+        self._context_menu_path = file_path
+
+        selected_count = len(self._selected_file_entries(self.file_list))
+        single = selected_count == 1
+        file_ext = _item_ext(item, file_path)
+        show_loop_editor = single and file_ext in _LOOP_EDITOR_EXTS
+        show_scd_actions = single and file_ext == '.scd'
+        actions['loop_editor'].setVisible(show_loop_editor)
+        actions['loop_editor_sep'].setVisible(show_loop_editor)
+        for key in ('normalize', 'normalize_sep', 'send', 'send_sep'):
+            actions[key].setVisible(show_scd_actions)
+        actions['rename'].setVisible(single)
+        self._file_list_menu.exec_(self.file_list.mapToGlobal(position))
 
     def show_kh_rando_context_menu(self, position):
         item = self.kh_rando_file_list.itemAt(position)
@@ -1383,20 +1938,22 @@ class LibraryController:
         file_path = item.data(Qt.UserRole)
         if not file_path or file_path.startswith("KH_CATEGORY_HEADER"):
             return
-        menu = QMenu(self.window)
-        selected_items = [item for item in self.kh_rando_file_list.selectedItems()
-                         if item.data(Qt.UserRole) and not item.data(Qt.UserRole).startswith("KH_CATEGORY_HEADER")]
-        if len(selected_items) == 1:
-            file_ext = os.path.splitext(file_path)[1].lower()
-            if file_ext in ['.scd', '.wav']:
-                loop_editor_action = menu.addAction("Open Loop Editor")
-                loop_editor_action.triggered.connect(self.window.open_loop_editor)
-                menu.addSeparator()
-            rename_action = menu.addAction("Rename")
-            rename_action.triggered.connect(lambda: self.rename_file(file_path))
-        delete_action = menu.addAction("Delete")
-        delete_action.triggered.connect(self.delete_selected_files)
-        menu.exec_(self.kh_rando_file_list.mapToGlobal(position))
+        if self._kh_rando_menu is None:
+            self._kh_rando_menu, self._kh_rando_actions = self._build_kh_rando_menu()
+        actions = self._kh_rando_actions
+        self._context_menu_path = file_path
+
+        selected_count = 0
+        for selected in self.kh_rando_file_list.selectedItems():
+            data = selected.data(Qt.UserRole)
+            if data and not data.startswith("KH_CATEGORY_HEADER"):
+                selected_count += 1
+        single = selected_count == 1
+        show_loop_editor = single and _item_ext(item, file_path) in _LOOP_EDITOR_EXTS
+        actions['loop_editor'].setVisible(show_loop_editor)
+        actions['loop_editor_sep'].setVisible(show_loop_editor)
+        actions['rename'].setVisible(single)
+        self._kh_rando_menu.exec_(self.kh_rando_file_list.mapToGlobal(position))
 
     def rename_file(self, file_path):
         path = Path(file_path)
@@ -1425,105 +1982,224 @@ class LibraryController:
             try:
                 path.rename(new_file_path)
                 logging.info(f"Renamed file: {path} -> {new_file_path}")
-                QTimer.singleShot(100, lambda: self._on_file_removed(str(path)))
-                QTimer.singleShot(200, lambda: self._on_file_added(str(new_file_path)))
+                self._pending_renames[str(path)] = str(new_file_path)
+                self._rename_timer.start()
             except Exception as e:
                 show_themed_message(self.window, QMessageBox.Critical, "Rename Error",
                                    f"Failed to rename file:\n{str(e)}")
 
+    def _flush_pending_renames(self):
+        pending = self._pending_renames
+        self._pending_renames = {}
+        for old_path, new_path in pending.items():
+            self._on_file_renamed(old_path, new_path)
+
+    def _consume_rename_event(self, file_path: str, event: str) -> bool:
+        """Return True if a watcher event for file_path belongs to a rename we already handle.
+
+        event is 'removed' or 'added'. A rename swallows exactly one removal of its
+        old path and one addition of its new path; anything else is passed on.
+        """
+        if file_path in self._pending_renames:
+            self._on_file_renamed(file_path, self._pending_renames.pop(file_path))
+        else:
+            for old_path, new_path in list(self._pending_renames.items()):
+                if new_path == file_path:
+                    del self._pending_renames[old_path]
+                    self._on_file_renamed(old_path, new_path)
+                    break
+        owed = self._recent_rename_paths.get(file_path)
+        if owed is None:
+            return False
+        owed_event, expiry = owed
+        if time.monotonic() >= expiry:
+            del self._recent_rename_paths[file_path]
+            return False
+        if owed_event != event:
+            return False
+        del self._recent_rename_paths[file_path]
+        return True
+
+    def _on_file_renamed(self, old_path: str, new_path: str):
+        """Update the rows and caches for a renamed file in place, without repopulating."""
+        logging.info(f"File renamed: {old_path} -> {new_path}")
+        self.window.invalidate_full_playlist_cache()
+        now = time.monotonic()
+        # Events that never arrived stop being owed once their window has passed
+        self._recent_rename_paths = {
+            path: owed for path, owed in self._recent_rename_paths.items() if owed[1] > now
+        }
+        expiry = now + _RENAME_SUPPRESS_WINDOW
+        self._recent_rename_paths[old_path] = ('removed', expiry)
+        self._recent_rename_paths[new_path] = ('added', expiry)
+        self._invalidate_exists(old_path)
+        self._invalidate_exists(new_path)
+        clear_stat_cache(old_path)
+        clear_stat_cache(new_path)
+        old_name = os.path.basename(old_path)
+        new_name = os.path.basename(new_path)
+
+        is_kh_rando_file = False
+        if self.library:
+            size = self.library.file_sizes.pop(old_path, None)
+            if size is not None:
+                self.library.file_sizes[new_path] = size
+            category_key = self.library.kh_rando_path_category.pop(old_path, None)
+            if category_key is not None:
+                self.library.kh_rando_path_category[new_path] = category_key
+                category_files = self.library.kh_rando_files_by_category.get(category_key, [])
+                for i, (fpath, display) in enumerate(category_files):
+                    if fpath == old_path:
+                        category_files[i] = (new_path, display.replace(old_name, new_name, 1))
+                        category_files.sort()
+                        is_kh_rando_file = True
+                        break
+        old_folder_name = _folder_group_name(old_path)
+        self._collapsed_haystacks.pop(old_folder_name, None)
+        folder_entries = self._files_by_folder_cache.get(old_folder_name, [])
+        for i, (text, fpath, color) in enumerate(folder_entries):
+            if fpath == old_path:
+                del folder_entries[i]
+                _insort_folder_entry(folder_entries, (text.replace(old_name, new_name, 1), new_path, color))
+                break
+
+        # The file can be shown in both the library and the KH Rando list
+        library_item = None
+        for list_widget, item in self._find_items_for_path(old_path):
+            item.setText(item.text().replace(old_name, new_name, 1))
+            item.setData(Qt.UserRole, new_path)
+            if list_widget is self.file_list:
+                library_item = item
+                set_search_keys(item, new_path)
+            if item.toolTip():
+                item.setToolTip(new_path)
+            self._unindex_item(item, old_path)
+            self._index_item(list_widget, item, new_path)
+
+        exporter = getattr(self.window, 'kh_rando_exporter', None)
+        if exporter:
+            if is_kh_rando_file:
+                # Renaming a KH Rando file can change which library files count as duplicates
+                self._refresh_duplicate_status()
+            elif library_item is not None:
+                self._update_item_duplicate_status(exporter, library_item, new_path)
+
+        if getattr(self.window, 'current_file', None) == old_path:
+            self.window.current_file = new_path
+        if self._current_visualizer_file == old_path:
+            self._current_visualizer_file = new_path
+
     # File watcher and scanning
     def perform_initial_scan(self):
         if not self.library:
             return
-        if hasattr(self.window, 'scan_overlay'):
-            self.window.scan_overlay.show()
+        overlay = self.window._ensure_scan_overlay()
+        overlay.show()
         self.library.scan_folders(self.window.config.library_folders, self.window.config.scan_subdirs, self.window.config.kh_rando_folder)
+        self._clear_index_for(self.file_list)
+        self.window.invalidate_full_playlist_cache()
         if self.organize_by_folder_cb.isChecked():
             self._organize_files_by_folder()
-        if hasattr(self.window, 'scan_overlay'):
-            self.window.scan_overlay.hide()
+        overlay.hide()
         logging.info("Initial library scan completed")
 
-    def _on_file_added(self, file_path: str):
-        logging.info(f"File added: {file_path}")
-        if self.library and self.library.kh_rando_exporter:
-            self.library.kh_rando_exporter.refresh_existing_files()
-        if self.library:
-            self.library._add_single_file(Path(file_path))
-        is_in_library = False
-        is_in_kh_rando = False
-        try:
-            file_path_obj = Path(file_path).resolve()
-            if self.window.config.kh_rando_folder:
-                kh_rando_path = Path(self.window.config.kh_rando_folder).resolve()
-                if file_path_obj.is_relative_to(kh_rando_path):
-                    is_in_kh_rando = True
-            if not is_in_kh_rando:
-                for folder in self.window.config.library_folders:
-                    folder_path = Path(folder).resolve()
-                    if file_path_obj.is_relative_to(folder_path):
-                        is_in_library = True
-                        break
-        except Exception:
-            pass
-        if is_in_library:
-            if self.organize_by_folder_cb.isChecked() and not is_in_kh_rando:
-                folder = os.path.dirname(file_path)
-                folder_name = os.path.basename(folder) if folder and folder != "." else "Files (No Folder)"
-                if folder_name not in self._files_by_folder_cache:
-                    self._files_by_folder_cache[folder_name] = []
-                display_text = os.path.basename(file_path)
-                size = Path(file_path).stat().st_size if Path(file_path).exists() else 0
-                from utils.helpers import format_file_size
-                display_text = f"{display_text} ({format_file_size(size)})"
-                self._files_by_folder_cache[folder_name].append((display_text, file_path, None))
+    def _on_file_added(self, file_path: str, size: int = None, mtime: float = None):
+        # size/mtime come from the watcher's own stat; None means stat lazily on flush
+        if self._consume_rename_event(file_path, 'added'):
+            return
+        self._pending_adds[file_path] = size
+        self._fs_flush_timer.start()
+
+    def _on_file_removed(self, file_path: str):
+        if self._consume_rename_event(file_path, 'removed'):
+            return
+        # A queued add followed by a remove cancels out; remove-then-add keeps both
+        self._pending_adds.pop(file_path, None)
+        self._pending_removes.add(file_path)
+        self._fs_flush_timer.start()
+
+    def _flush_fs_events(self):
+        """Apply the queued watcher adds/removes with one refresh of each view."""
+        adds, removes = self._pending_adds, self._pending_removes
+        self._pending_adds, self._pending_removes = {}, set()
+        if not adds and not removes:
+            return
+        self.window.invalidate_full_playlist_cache()
+        organize_by_folder = self.organize_by_folder_cb.isChecked()
+        expanded_folders = self._get_expanded_folder_items() if organize_by_folder and removes else None
+
+        for file_path in removes:
+            clear_stat_cache(file_path)
+        library_changed = kh_rando_changed = False
+        changed_paths = set()
+        for file_path in sorted(removes):
+            logging.info(f"File removed: {file_path}")
+            if self.library and file_path in self.library.kh_rando_path_category:
+                kh_rando_changed = True
+            else:
+                try:
+                    library_changed = library_changed or self._is_under_library(self._rp(file_path))
+                except Exception:
+                    pass
+            self._realpath_cache.pop(file_path, None)
+            self._remove_file_from_display(file_path)
+            self._remove_file_from_folder_cache(file_path)
+            changed_paths.add(file_path)
+
+        exporter = self.library.kh_rando_exporter if self.library else None
+        if exporter and (adds or kh_rando_changed):
+            exporter.refresh_existing_files()
+        for file_path, size in sorted(adds.items()):
+            logging.info(f"File added: {file_path}")
+            changed_paths.add(file_path)
+            if self.library:
+                self.library._add_single_file(Path(file_path), size)
+            try:
+                resolved = self._rp(file_path)
+                if self._is_under_kh_rando(resolved):
+                    kh_rando_changed = True
+                    continue
+                if not self._is_under_library(resolved):
+                    continue
+            except Exception:
+                continue
+            library_changed = True
+            if organize_by_folder:
+                if size is None:
+                    try:
+                        size = cached_stat(file_path)[0]
+                    except OSError:
+                        size = 0
+                display_text = f"{os.path.basename(file_path)} ({format_file_size(size)})"
+                self._add_file_to_folder_cache(file_path, display_text, None)
+
+        if library_changed:
+            if organize_by_folder:
                 self._organize_files_by_folder()
+                if expanded_folders is not None:
+                    self._restore_expanded_folder_items(expanded_folders)
             else:
                 self.filter_library_files()
-        self._populate_kh_rando_list()
-        self._update_kh_rando_section_counts()
-        self._refresh_duplicate_status()
-
-    def _on_file_removed(self, file_path: str):
-        logging.info(f"File removed: {file_path}")
-        self._remove_file_from_display(file_path)
-        self._populate_kh_rando_list()
-        if self.organize_by_folder_cb.isChecked():
-            expanded_folders = self._get_expanded_folder_items()
-            if self._files_by_folder_cache:
-                for folder_name in list(self._files_by_folder_cache.keys()):
-                    self._files_by_folder_cache[folder_name] = [
-                        (text, fpath, color) for text, fpath, color in self._files_by_folder_cache[folder_name]
-                        if fpath != file_path
-                    ]
-                    if not self._files_by_folder_cache[folder_name]:
-                        del self._files_by_folder_cache[folder_name]
-            self._organize_files_by_folder()
-            self._restore_expanded_folder_items(expanded_folders)
-        else:
-            self.filter_library_files()
-        self._update_kh_rando_section_counts()
-        self._refresh_duplicate_status()
+        # Events outside the library and KH Rando folders change neither view
+        if kh_rando_changed:
+            self._update_kh_rando_section_counts()
+        if kh_rando_changed or library_changed:
+            self._refresh_duplicate_status(paths=changed_paths)
 
     def _on_directory_added(self, directory_path: str):
         logging.info(f"Directory added: {directory_path}")
-        is_in_library = False
         try:
-            dir_path_obj = Path(directory_path).resolve()
-            for folder in self.window.config.library_folders:
-                folder_path = Path(folder).resolve()
-                if dir_path_obj.is_relative_to(folder_path):
-                    is_in_library = True
-                    break
-        except Exception:
-            pass
-        if is_in_library and self.organize_by_folder_cb.isChecked():
+            resolved = self._rp(directory_path)
+        except (ValueError, OSError) as e:
+            logging.warning(f"Error checking directory path: {e}")
+            return
+        # Without subdirectory scanning a new folder adds nothing to the library view
+        if (self.window.config.scan_subdirs and self.organize_by_folder_cb.isChecked()
+                and self._is_under_library(resolved)):
             QTimer.singleShot(200, self._organize_files_by_folder)
         if self.window.config.kh_rando_folder:
             try:
-                dir_path = Path(directory_path).resolve()
-                kh_rando_path = Path(self.window.config.kh_rando_folder).resolve()
-                if dir_path.is_relative_to(kh_rando_path):
+                if self._is_under_kh_rando(resolved):
                     if self.library and self.library.kh_rando_exporter:
                         self.library.kh_rando_exporter.refresh_existing_files()
                     QTimer.singleShot(200, lambda: (
@@ -1537,11 +2213,11 @@ class LibraryController:
 
     def _on_directory_removed(self, directory_path: str):
         logging.info(f"Directory removed: {directory_path}")
+        # The removed directory may be recreated as a link; resolve it afresh next time
+        self._realpath_cache.pop(directory_path, None)
         if self.window.config.kh_rando_folder:
             try:
-                dir_path = Path(directory_path).resolve()
-                kh_rando_path = Path(self.window.config.kh_rando_folder).resolve()
-                if dir_path.is_relative_to(kh_rando_path) or str(dir_path) == str(kh_rando_path):
+                if self._is_under_kh_rando(self._rp(directory_path)):
                     if self.library and self.library.kh_rando_exporter:
                         self.library.kh_rando_exporter.refresh_existing_files()
                     QTimer.singleShot(200, lambda: (
@@ -1553,40 +2229,112 @@ class LibraryController:
             except (ValueError, OSError) as e:
                 logging.warning(f"Error checking directory path: {e}")
 
+    def _refresh_resolved_roots(self):
+        config = self.window.config
+        key = (tuple(config.library_folders), config.kh_rando_folder)
+        if key == self._roots_key:
+            return
+        self._roots_key = key
+        self._realpath_cache.clear()
+        roots = []
+        for folder in config.library_folders:
+            try:
+                root = _normalized_real_path(folder)
+            except (ValueError, OSError):
+                continue
+            roots.append((root, _root_prefix(root)))
+        self._resolved_library_roots = roots
+        self._resolved_kh_rando_root = None
+        if config.kh_rando_folder:
+            try:
+                root = _normalized_real_path(config.kh_rando_folder)
+                self._resolved_kh_rando_root = (root, _root_prefix(root))
+            except (ValueError, OSError):
+                pass
+
+    def _rp(self, path):
+        """Normalized realpath of path, resolved once and then served from a cache."""
+        resolved = self._realpath_cache.get(path)
+        if resolved is None:
+            resolved = _normalized_real_path(path)
+            self._realpath_cache[path] = resolved
+        return resolved
+
+    def _is_under_library(self, resolved_path):
+        """True if an already-normalized path is a library folder or inside one."""
+        self._refresh_resolved_roots()
+        return any(resolved_path == root or resolved_path.startswith(prefix)
+                   for root, prefix in self._resolved_library_roots)
+
+    def _is_under_kh_rando(self, resolved_path):
+        """True if an already-normalized path is the KH Rando folder or inside it."""
+        self._refresh_resolved_roots()
+        if self._resolved_kh_rando_root is None:
+            return False
+        root, prefix = self._resolved_kh_rando_root
+        return resolved_path == root or resolved_path.startswith(prefix)
+
     def _on_file_modified(self, file_path: str):
         logging.info(f"File modified: {file_path}")
+        clear_stat_cache(file_path)
 
     def _remove_file_from_display(self, file_path: str):
         file_path_str = str(file_path)
-        for i in range(self.file_list.count() - 1, -1, -1):
-            item = self.file_list.item(i)
-            if item and item.data(Qt.UserRole) == file_path_str:
-                self.file_list.takeItem(i)
-                break
-        if hasattr(self.library, 'kh_rando_files_by_category'):
-            for category_key in list(self.library.kh_rando_files_by_category.keys()):
-                self.library.kh_rando_files_by_category[category_key] = [
-                    (fpath, display) for fpath, display in self.library.kh_rando_files_by_category[category_key]
-                    if fpath != file_path_str
-                ]
+        if not self.library:
+            return
+        item = self.library.file_list_index.get(file_path_str)
+        if item is not None and not sip.isdeleted(item) and item.listWidget() is self.file_list:
+            self.file_list.takeItem(self.file_list.row(item))
+        if item is not None:
+            self._unindex_item(item, file_path_str)
+        category_key = self.library.kh_rando_path_category.pop(file_path_str, None)
+        if category_key is not None:
+            category_files = self.library.kh_rando_files_by_category.get(category_key, [])
+            for i, (fpath, _) in enumerate(category_files):
+                if fpath == file_path_str:
+                    del category_files[i]
+                    break
 
     # Drag and drop
+    @staticmethod
+    def _selected_file_entries(list_widget):
+        """Return (item, path) for each selected file row, skipping folder headers by their role flag."""
+        entries = []
+        for item in list_widget.selectedItems():
+            if item.data(FOLDER_HEADER_ROLE):
+                continue
+            file_path = item.data(Qt.UserRole)
+            if file_path:
+                entries.append((item, file_path))
+        return entries
+
     def start_file_drag(self, list_widget, supportedActions):
-        selected_items = [item for item in list_widget.selectedItems()
-                         if item.data(Qt.UserRole) and not item.data(Qt.UserRole).startswith("FOLDER_HEADER")]
+        selected_items = self._selected_file_entries(list_widget)
         if not selected_items:
             return
         mime_data = QMimeData()
-        file_paths = []
-        for item in selected_items:
-            file_path = item.data(Qt.UserRole)
-            if file_path:
-                file_paths.append(file_path)
-        mime_data.setText("\n".join(file_paths))
+        mime_data.setText("\n".join(file_path for _, file_path in selected_items))
 
         drag = QDrag(list_widget)
         drag.setMimeData(mime_data)
 
+        if len(selected_items) == 1:
+            text = f"📄 {selected_items[0][0].text()[:25]}"
+        else:
+            text = f"📄 {len(selected_items)} files"
+        pixmap = self._drag_pixmap(text)
+        drag.setPixmap(pixmap)
+        drag.setHotSpot(pixmap.rect().center())
+        drag.exec_(Qt.CopyAction)
+
+    def _drag_pixmap(self, text):
+        """Return the rounded drag badge for text, rendering it only on a cache miss."""
+        key = f"drag:{text}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        if LibraryController._DRAG_FONT is None:
+            LibraryController._DRAG_FONT = QFont("Segoe UI", 10)
         pixmap_width = 200
         pixmap_height = 40
         pixmap = QPixmap(pixmap_width, pixmap_height)
@@ -1599,18 +2347,12 @@ class LibraryController:
         painter.drawRoundedRect(0, 0, pixmap_width, pixmap_height, 5, 5)
         painter.setOpacity(1.0)
         painter.setPen(Qt.white)
-        font = QFont("Segoe UI", 10)
-        painter.setFont(font)
-        if len(selected_items) == 1:
-            text = f"📄 {selected_items[0].text()[:25]}"
-        else:
-            text = f"📄 {len(selected_items)} files"
+        painter.setFont(LibraryController._DRAG_FONT)
         painter.drawText(10, 5, pixmap_width - 20, pixmap_height - 10,
                         Qt.AlignLeft | Qt.AlignVCenter, text)
         painter.end()
-        drag.setPixmap(pixmap)
-        drag.setHotSpot(pixmap.rect().center())
-        drag.exec_(Qt.CopyAction)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
 
     def kh_rando_drag_enter_event(self, event):
         if event.mimeData().hasText() or event.source() == self.file_list:
@@ -1623,6 +2365,15 @@ class LibraryController:
             event.ignore()
             return
         drop_position = event.pos()
+        target_item = self.kh_rando_file_list.itemAt(drop_position)
+        row = self.kh_rando_file_list.row(target_item) if target_item else -1
+        now = time.monotonic_ns() // 1_000_000
+        if row == self._last_drag_row and now - self._last_drag_time < _DRAG_MOVE_INTERVAL_MS:
+            event.acceptProposedAction()
+            return
+        self._last_drag_row = row
+        self._last_drag_time = now
+
         list_height = self.kh_rando_file_list.height()
         scroll_margin = 30
         if drop_position.y() < scroll_margin:
@@ -1631,95 +2382,86 @@ class LibraryController:
         elif drop_position.y() > list_height - scroll_margin:
             current_value = self.kh_rando_file_list.verticalScrollBar().value()
             self.kh_rando_file_list.verticalScrollBar().setValue(current_value + 5)
-        if self._drag_hover_item:
-            font = self._drag_hover_item.font()
-            font.setBold(False)
-            self._drag_hover_item.setFont(font)
-            self._drag_hover_item.setBackground(Qt.transparent)
-            self._drag_hover_item = None
-        target_item = self.kh_rando_file_list.itemAt(drop_position)
+
+        header_item = None
         if target_item:
-            item_data = target_item.data(Qt.UserRole)
-            if item_data and item_data.startswith("KH_CATEGORY_HEADER:"):
-                font = target_item.font()
-                font.setBold(True)
-                target_item.setFont(font)
-                target_item.setBackground(QColor(86, 156, 214, 80))
-                self._drag_hover_item = target_item
-            elif item_data and not item_data.startswith("KH_CATEGORY_HEADER:"):
-                for i in range(self.kh_rando_file_list.row(target_item), -1, -1):
-                    check_item = self.kh_rando_file_list.item(i)
-                    check_data = check_item.data(Qt.UserRole)
-                    if check_data and check_data.startswith("KH_CATEGORY_HEADER:"):
-                        font = check_item.font()
-                        font.setBold(True)
-                        check_item.setFont(font)
-                        check_item.setBackground(QColor(86, 156, 214, 80))
-                        self._drag_hover_item = check_item
-                        break
+            header_item = self._kh_category_headers.get(target_item.data(KH_CATEGORY_ROLE))
+        if header_item is self._drag_hover_item:
+            # Still over the same category; leave the highlight as it is
+            event.acceptProposedAction()
+            return
+        self._clear_drag_hover()
+        if header_item is not None:
+            font = header_item.font()
+            font.setBold(True)
+            header_item.setFont(font)
+            header_item.setBackground(QColor(86, 156, 214, 80))
+            self._drag_hover_item = header_item
         event.acceptProposedAction()
 
-    def kh_rando_drag_leave_event(self, event):
+    def _clear_drag_hover(self):
         if self._drag_hover_item:
-            font = self._drag_hover_item.font()
-            font.setBold(False)
-            self._drag_hover_item.setFont(font)
-            self._drag_hover_item.setBackground(Qt.transparent)
+            if not sip.isdeleted(self._drag_hover_item):
+                font = self._drag_hover_item.font()
+                font.setBold(False)
+                self._drag_hover_item.setFont(font)
+                self._drag_hover_item.setBackground(Qt.transparent)
             self._drag_hover_item = None
+
+    def kh_rando_drag_leave_event(self, event):
+        self._clear_drag_hover()
+        self._last_drag_row = None
         event.accept()
 
     def kh_rando_drop_event(self, event):
-        if self._drag_hover_item:
-            font = self._drag_hover_item.font()
-            font.setBold(False)
-            self._drag_hover_item.setFont(font)
-            self._drag_hover_item.setBackground(Qt.transparent)
-            self._drag_hover_item = None
+        self._clear_drag_hover()
+        self._last_drag_row = None
         if not (event.mimeData().hasText() or event.source() == self.file_list):
             event.ignore()
             return
         drop_position = event.pos()
         target_item = self.kh_rando_file_list.itemAt(drop_position)
-        selected_items = [item for item in self.file_list.selectedItems()
-                        if item.data(Qt.UserRole) and not item.data(Qt.UserRole).startswith("FOLDER_HEADER")]
+        selected_items = self._selected_file_entries(self.file_list)
         if not selected_items:
             event.ignore()
             return
         target_category = None
         if target_item:
-            item_data = target_item.data(Qt.UserRole)
-            if item_data:
-                if item_data.startswith("KH_CATEGORY_HEADER:"):
-                    target_category = item_data.replace("KH_CATEGORY_HEADER:", "")
-                else:
-                    for i in range(self.kh_rando_file_list.row(target_item), -1, -1):
-                        check_item = self.kh_rando_file_list.item(i)
-                        check_data = check_item.data(Qt.UserRole)
-                        if check_data and check_data.startswith("KH_CATEGORY_HEADER:"):
-                            target_category = check_data.replace("KH_CATEGORY_HEADER:", "")
-                            break
+            target_category = target_item.data(KH_CATEGORY_ROLE)
         if not target_category:
             show_themed_message(self.window, QMessageBox.Information, "Drop Target",
                                "Please drop files onto a KH Rando category folder.")
             event.ignore()
             return
-        self.export_files_to_category_instant(selected_items, target_category)
+        self.export_files_to_category_instant([file_path for _, file_path in selected_items], target_category)
         event.acceptProposedAction()
 
-    def export_files_to_category_instant(self, items, category):
-        from ui.conversion_manager import SimpleStatusDialog
-        from ui.conversion_manager import QualitySelectionDialog
-
+    def export_files_to_category_instant(self, paths, category):
+        """Export already-extracted file paths (no header rows) to a KH Rando category."""
+        if self._export_thread is not None:
+            show_themed_message(self.window, QMessageBox.Information, "Export In Progress",
+                               "Please wait for the current KH Rando export to finish.")
+            return
+        # Classify by suffix; files to convert carry (path, basename, stem, ext) for the temp names
         scd_files = []
         files_to_convert = []
-        for item in items:
-            file_path = item.data(Qt.UserRole)
-            if file_path and not file_path.startswith("FOLDER_HEADER") and os.path.exists(file_path):
-                file_ext = os.path.splitext(file_path)[1].lower()
-                if file_ext == '.scd':
-                    scd_files.append(file_path)
-                elif file_ext in ['.wav', '.mp3', '.ogg', '.flac']:
-                    files_to_convert.append(file_path)
+        existing = existing_paths(paths)
+        for file_path in paths:
+            low = file_path.lower()
+            if low.endswith(_SCD_EXTS):
+                bucket = scd_files
+            elif low.endswith(_CONVERT_EXTS):
+                bucket = files_to_convert
+            else:
+                continue
+            if file_path not in existing:
+                continue
+            if bucket is scd_files:
+                scd_files.append(file_path)
+            else:
+                base = os.path.basename(file_path)
+                stem, ext = os.path.splitext(base)
+                files_to_convert.append((file_path, base, stem, ext.lower()))
         if not scd_files and not files_to_convert:
             return
         if not self.window.config.kh_rando_folder or not os.path.exists(self.window.config.kh_rando_folder):
@@ -1734,96 +2476,243 @@ class LibraryController:
                 return
             selected_quality = quality_dialog.get_quality()
 
-        final_files = scd_files.copy()
-        converted_files = []
+        # Watcher flushes rescan existing_files while the exported files land, so the
+        # duplicate refresh compares against the category as it was before this export
+        exporter = self.window.kh_rando_exporter
+        self._export_baselines.setdefault(category, set(exporter.existing_files.get(category, ())))
+
+        # Conversion and export run on a worker thread; the dialog only receives status text
+        export_dialog = SimpleStatusDialog("Exporting to KH Rando", self.window)
         if files_to_convert:
-            status_dialog = SimpleStatusDialog("Converting Files", self.window)
-            status_dialog.update_status(f"Converting {len(files_to_convert)} file(s) for export...")
-            status_dialog.show()
-            apply_title_bar_theming(status_dialog)
-            QApplication.processEvents()
-            for file_path in files_to_convert:
-                try:
-                    filename = os.path.basename(file_path)
-                    status_dialog.update_status(f"Converting: {filename}")
-                    QApplication.processEvents()
-                    file_ext = os.path.splitext(file_path)[1].lower()
-                    temp_scd = os.path.join(tempfile.gettempdir(), f"{os.path.splitext(filename)[0]}.scd")
-                    temp_wav = None
-                    source_file = file_path
-                    success = False
-                    try:
-                        if file_ext != '.wav':
-                            fd, temp_wav = tempfile.mkstemp(suffix='.wav', prefix='scdconv_')
-                            os.close(fd)
-                            success_ffmpeg = self.window.converter.convert_with_ffmpeg(file_path, temp_wav, 'wav')
-                            if not success_ffmpeg:
-                                if temp_wav:
-                                    try:
-                                        os.remove(temp_wav)
-                                    except Exception:
-                                        pass
-                                logging.warning(f"FFmpeg conversion failed for: {filename}")
-                                raise Exception("FFmpeg conversion failed")
-                            source_file = temp_wav
-                        original_scd_template = file_path if file_ext == '.scd' else None
-                        success = self.window.converter.convert_wav_to_scd(source_file, temp_scd, original_scd_template, selected_quality)
-                    finally:
-                        if temp_wav:
-                            try:
-                                os.remove(temp_wav)
-                            except Exception:
-                                pass
-                    if success and os.path.exists(temp_scd):
-                        final_files.append(temp_scd)
-                        converted_files.append(temp_scd)
-                    else:
-                        logging.warning(f"Conversion failed for: {filename}")
-                except Exception as e:
-                    logging.error(f"Error converting {file_path}: {e}")
-            status_dialog.close_dialog()
-
-        if final_files:
-            export_dialog = SimpleStatusDialog("Exporting to KH Rando", self.window)
-            export_dialog.update_status(f"Exporting {len(final_files)} file(s) to {category}...")
-            export_dialog.show()
-            apply_title_bar_theming(export_dialog)
-            QApplication.processEvents()
-            success_count = 0
-            fail_count = 0
-            for file_path in final_files:
-                try:
-                    filename = Path(file_path).name
-                    export_dialog.update_status(f"Exporting: {filename}")
-                    QApplication.processEvents()
-                    success = self.window.kh_rando_exporter.export_file(
-                        file_path, category, self.window.config.kh_rando_folder
-                    )
-                    if success:
-                        success_count += 1
-                    else:
-                        fail_count += 1
-                except Exception as e:
-                    logging.error(f"Error exporting {file_path}: {e}")
-                    fail_count += 1
-            export_dialog.close_dialog()
-            for temp_file in converted_files:
-                try:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                except Exception:
-                    pass
-            if success_count > 0:
-                message = f"Successfully exported {success_count} file(s) to {category}"
-                if fail_count > 0:
-                    message += f"\n{fail_count} file(s) failed to export"
-                show_themed_message(self.window, QMessageBox.Information, "Export Complete", message)
-                self._refresh_duplicate_status()
-                self._populate_kh_rando_list()
-                self._update_kh_rando_section_counts()
+            export_dialog.status_label.setText(f"Converting {len(files_to_convert)} file(s) for export...")
+        else:
+            export_dialog.status_label.setText(f"Exporting {len(scd_files)} file(s) to {category}...")
+        export_dialog.show()
+        apply_title_bar_theming(export_dialog)
+
+        self._export_dialog = export_dialog
+        self._export_thread = QThread(self.window)
+        self._export_worker = _ExportWorker(
+            self.window.config.kh_rando_folder,
+            scd_files, files_to_convert, category, selected_quality
+        )
+        self._export_worker.moveToThread(self._export_thread)
+
+        self._export_thread.started.connect(self._export_worker.run)
+        self._export_worker.progress.connect(export_dialog.status_label.setText)
+        self._export_worker.finished.connect(self._on_export_finished)
+        self._export_worker.finished.connect(self._export_thread.quit)
+        self._export_worker.finished.connect(self._export_worker.deleteLater)
+        self._export_thread.finished.connect(self._export_thread.deleteLater)
+
+        self._export_thread.start()
+
+    def _on_export_finished(self, success_count, fail_count, category):
+        if self._export_dialog is not None:
+            self._export_dialog.close_dialog()
+        self._export_dialog = None
+        self._export_thread = None
+        self._export_worker = None
+        converter = getattr(self.window, 'converter', None)
+        if converter is not None:
+            # Pick up the loudness checks the export's own converter recorded
+            converter.reload_sanitize_cache()
+
+        if success_count > 0:
+            message = f"Successfully exported {success_count} file(s) to {category}"
+            if fail_count > 0:
+                message += f"\n{fail_count} file(s) failed to export"
+            show_themed_message(self.window, QMessageBox.Information, "Export Complete", message)
+            self._post_export_categories.add(category)
+            self._post_export_timer.start()
+        else:
+            if category not in self._post_export_categories:
+                self._export_baselines.pop(category, None)
+            show_themed_message(self.window, QMessageBox.Warning, "Export Failed",
+                               "Failed to export files. Check the log for details.")
+
+    def _flush_post_export_refresh(self):
+        """Refresh duplicate badges and KH Rando counts once for all exports since the last flush."""
+        categories, self._post_export_categories = self._post_export_categories, set()
+        if not categories:
+            return
+        with _frozen_list(self.file_list), _frozen_list(self.kh_rando_file_list):
+            for category in categories:
+                self._refresh_duplicate_status(category=category, before=self._export_baselines.pop(category, None))
+            self._update_kh_rando_section_counts()
+
+
+def _convert_file_to_scd(converter, file_path, temp_scd, quality):
+    """Convert one audio file to an SCD at temp_scd, going through a temporary WAV if needed."""
+    filename = os.path.basename(file_path)
+    file_ext = os.path.splitext(file_path)[1].lower()
+    temp_wav = None
+    source_file = file_path
+    try:
+        if file_ext != '.wav':
+            fd, temp_wav = tempfile.mkstemp(suffix='.wav', prefix='scdconv_')
+            os.close(fd)
+            if not converter.convert_with_ffmpeg(file_path, temp_wav, 'wav'):
+                logging.warning(f"FFmpeg conversion failed for: {filename}")
+                return False
+            source_file = temp_wav
+        original_scd_template = file_path if file_ext == '.scd' else None
+        return converter.convert_wav_to_scd(source_file, temp_scd, original_scd_template, quality)
+    finally:
+        if temp_wav:
+            try:
+                os.remove(temp_wav)
+            except Exception:
+                pass
+
+
+class _ConvertTaskSignals(QObject):
+    status = pyqtSignal(str)
+
+
+class _ConvertToScdTask(QRunnable):
+    """Convert a single file to SCD on a thread pool thread."""
+
+    _local = threading.local()
+
+    def __init__(self, index, file_path, temp_scd, quality, results, lock, signals):
+        super().__init__()
+        self.index = index
+        self.file_path = file_path
+        self.temp_scd = temp_scd
+        self.quality = quality
+        self.results = results
+        self.lock = lock
+        self.signals = signals
+
+    def _get_thread_converter(self):
+        from core.converter import AudioConverter
+
+        converter = getattr(self._local, "converter", None)
+        if converter is None:
+            converter = AudioConverter()
+            self._local.converter = converter
+        return converter
+
+    def run(self):
+        self.signals.status.emit(f"Converting: {os.path.basename(self.file_path)}")
+        success = False
+        try:
+            success = _convert_file_to_scd(self._get_thread_converter(), self.file_path, self.temp_scd, self.quality)
+        except Exception as e:
+            logging.error(f"Error converting {self.file_path}: {e}")
+        with self.lock:
+            self.results.append((self.index, self.file_path, self.temp_scd, bool(success)))
+
+
+class _ExportWorker(QObject):
+    """Convert and export files to a KH Rando category off the GUI thread."""
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(int, int, str)
+
+    def __init__(self, kh_rando_folder, scd_files, files_to_convert, category, quality):
+        super().__init__()
+        self.exporter = None  # created on the worker thread, see run
+        self.kh_rando_folder = kh_rando_folder
+        self.scd_files = list(scd_files)
+        self.files_to_convert = list(files_to_convert)
+        self.category = category
+        self.quality = quality
+
+    def _start_conversions(self):
+        """Queue every conversion on a pool and return (pool, results, signals, skipped) without waiting.
+
+        skipped counts selected files left out because another one converts to the same name.
+        """
+        # Conversions are independent and CPU bound: fan them out on a pool
+        signals = _ConvertTaskSignals()
+        signals.status.connect(self.progress, Qt.DirectConnection)
+        results = []
+        results_lock = threading.Lock()
+        pool = QThreadPool()
+        pool.setMaxThreadCount(os.cpu_count() or 1)
+        claimed_outputs = set()
+        skipped = 0
+        temp_dir = tempfile.gettempdir()
+        for index, (file_path, filename, stem, _) in enumerate(self.files_to_convert):
+            temp_scd = os.path.join(temp_dir, f"{stem}.scd")
+            if temp_scd in claimed_outputs:
+                logging.warning(f"Skipping {filename}: another selected file converts to the same name")
+                skipped += 1
+                continue
+            claimed_outputs.add(temp_scd)
+            pool.start(_ConvertToScdTask(index, file_path, temp_scd, self.quality, results, results_lock, signals))
+        # The pool and signals object must outlive the tasks; the caller keeps them until waiting
+        return pool, results, signals, skipped
+
+    @staticmethod
+    def _collect_conversions(pool, results):
+        """Wait for the queued conversions and return the SCDs that were produced, in selection order."""
+        pool.waitForDone()
+        converted_files = []
+        for _, file_path, temp_scd, success in sorted(results):
+            if success and os.path.exists(temp_scd):
+                converted_files.append(temp_scd)
             else:
-                show_themed_message(self.window, QMessageBox.Warning, "Export Failed",
-                                   "Failed to export files. Check the log for details.")
+                logging.warning(f"Conversion failed for: {os.path.basename(file_path)}")
+        return converted_files
+
+    def _export_files(self, file_paths):
+        """Export file_paths one by one; returns (success_count, fail_count)."""
+        success_count = 0
+        fail_count = 0
+        for file_path in file_paths:
+            try:
+                self.progress.emit(f"Exporting: {os.path.basename(file_path)}")
+                if self.exporter.export_file(file_path, self.category, self.kh_rando_folder):
+                    success_count += 1
+                else:
+                    fail_count += 1
+            except Exception as e:
+                logging.error(f"Error exporting {file_path}: {e}")
+                fail_count += 1
+        return success_count, fail_count
+
+    def run(self):
+        from core.converter import AudioConverter
+        from core.kh_rando import KHRandoExporter
+        # The GUI thread keeps using, refreshing and cleaning up the window's converter
+        # and exporter while this runs, so exports go through a private pair
+        converter = AudioConverter()
+        self.exporter = KHRandoExporter(converter=converter)
+        # Files that are already SCD are exported while the conversions run on
+        # the pool; exports themselves stay on this thread since they share the
+        # exporter's converter
+        conversions = self._start_conversions() if self.files_to_convert else None
+        success_count, fail_count = self._export_files(self.scd_files)
+        converted_files = []
+        if conversions is not None:
+            pool, results, _signals, skipped = conversions
+            converted_files = self._collect_conversions(pool, results)
+            converted_ok, converted_failed = self._export_files(converted_files)
+            success_count += converted_ok
+            # Failed conversions and skipped name collisions show up in the summary as failures
+            fail_count += converted_failed + (len(results) - len(converted_files)) + skipped
+        converter.cleanup_temp_files()
+        self.finished.emit(success_count, fail_count, self.category)
+        # Report first; deleting the converted temp files is fire-and-forget
+        if converted_files:
+            QThreadPool.globalInstance().start(_TempCleanupTask(converted_files))
+
+
+class _TempCleanupTask(QRunnable):
+    """Delete temporary files on a pool thread, ignoring files that are already gone."""
+
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = list(paths)
+
+    def run(self):
+        for path in self.paths:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
 
 
 class NormalizeDialog(QDialog):
@@ -2053,6 +2942,10 @@ class NormalizeDialog(QDialog):
         except Exception:
             pass
 
+        # Normalized files were rewritten in place
+        for path_str in paths or []:
+            clear_stat_cache(path_str)
+
         error_paths = {p for p, _ in (errors or [])}
         if self._progress_dialog:
             self._progress_dialog.setValue(len(paths or []))
@@ -2221,7 +3114,6 @@ class _KH2MonitorWorker(QObject):
     
     def run(self):
         from core.kh2_hook import get_hook
-        import time
         
         hook = get_hook()
         was_connected = False
@@ -27,8 +27,9 @@ class StartupController:
             ("Setting up file watcher", self.window._init_file_watcher),
             ("Creating managers", self.window._init_managers),
             ("Registering shortcuts", self.window._init_shortcuts),
-            ("Preparing audio analyzer", self.window._init_audio_analyzer_deferred),
-            ("Starting update checker", self.window._init_updater_deferred),
+            ("Preparing audio analyzer", self.window._initialize_audio_analyzer),
+            ("Creating visualizer", self.window.visualizer_host.create),
+            ("Starting update checker", self.window._initialize_auto_updater),
         ]
         self._perform_next_stage()
 
@@ -41,7 +42,8 @@ class StartupController:
                 self._overlay.update_progress(percent, desc)
             func()
             self._stage_index += 1
-            QTimer.singleShot(10, self._perform_next_stage)
+            # One stage per event-loop pass keeps the overlay painting between stages
+            QTimer.singleShot(0, self._perform_next_stage)
         else:
             if self._overlay:
                 self._overlay.update_progress(100, "Ready")
@@ -8,15 +8,17 @@ class VisualizerHost(QObject):
         self.window = window
         self.visualizer = None
         self._installed_filters = False
+        self._last_geometry = None
 
     def create(self):
         """Create and attach the visualizer to the player panel."""
-        if not hasattr(self.window, "player_panel"):
+        if self.window.player_panel is None:
             return
 
         from ui.visualizer import VisualizerWidget
 
         self.visualizer = VisualizerWidget(self.window.player_panel)
+        self._last_geometry = None
         # Allow the visualizer to shrink when the window is short
         self.visualizer.setMinimumHeight(150)
         self.visualizer.visualizer_changed.connect(self.window.on_visualizer_changed)
@@ -32,7 +34,7 @@ class VisualizerHost(QObject):
             self._installed_filters = True
 
         # Connect to audio analyzer if ready
-        if hasattr(self.window, "audio_analyzer") and self.window.audio_analyzer:
+        if self.window.audio_analyzer is not None:
             self.visualizer.set_audio_callback(self.window.get_visualizer_audio_data)
 
     def _position(self):
@@ -47,7 +49,12 @@ class VisualizerHost(QObject):
 
         # Stick to the bottom of the player panel; align left to contents rect
         y_pos = rect.bottom() - desired_height + 1  # +1 because bottom is inclusive
-        self.visualizer.setGeometry(rect.left(), max(rect.top(), y_pos), parent_width, desired_height)
+        geometry = (rect.left(), max(rect.top(), y_pos), parent_width, desired_height)
+        # Window and panel resizes both land here; skip the relayout when nothing moved
+        if geometry == self._last_geometry:
+            return
+        self._last_geometry = geometry
+        self.visualizer.setGeometry(*geometry)
         self.visualizer.raise_()
 
     def _on_player_panel_resize(self, event):
@@ -29,6 +29,13 @@ DARK_THEME = '''
         color: #666666;
         border: 1px solid #2a2a2a;
     }
+    QPushButton[loopState="on"] {
+        background-color: #2a5a2a;
+        border: 2px solid #4a8a4a;
+    }
+    QPushButton[loopState="on"]:hover {
+        background-color: #3a7a3a;
+    }
     QSlider::groove:horizontal {
         height: 4px;
         background: #404040;
@@ -198,6 +205,14 @@ DARK_THEME = '''
     QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
         background: transparent;
     }
+    QLabel#metadataLabel {
+        background-color: #111111;
+        border: 1px solid #333;
+        padding: 8px;
+        border-radius: 4px;
+        color: #ffffff;
+        font-size: 11px;
+    }
 '''
 
 # Reusable button styles (loop editor and dialogs)
@@ -3,7 +3,7 @@ import math
 import logging
 from PyQt5.QtWidgets import QLabel, QSplashScreen, QSlider
 from PyQt5.QtCore import QTimer, Qt, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt5.QtGui import QIcon, QPixmap, QPainter, QColor, QFont, QPolygon, QPen, QRadialGradient
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache, QPainter, QColor, QFont, QPolygon, QPen, QRadialGradient
 from PyQt5.QtCore import QPoint, QRect
 from PyQt5.QtSvg import QSvgRenderer
 
@@ -182,7 +182,7 @@ class LoopSlider(QSlider):
         
     def set_loop_markers(self, start, end, total_duration):
         """Set loop markers positions (all in milliseconds)"""
-        print(f"DEBUG: Setting loop markers - start: {start}ms, end: {end}ms, total: {total_duration}ms")
+        logging.debug(f"Setting loop markers - start: {start}ms, end: {end}ms, total: {total_duration}ms")
         if total_duration > 0:
             self.loop_start = start
             self.loop_end = end
@@ -240,7 +240,16 @@ class LoopSlider(QSlider):
 
 
 def create_icon(icon_type, size=24):
-    """Create simple icons using QPainter"""
+    """Create simple icons using QPainter, reusing glyphs already in the pixmap cache"""
+    key = f"scdtoolkit_icon:{icon_type}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = _paint_icon_pixmap(icon_type, size)
+        QPixmapCache.insert(key, pixmap)
+    return QIcon(pixmap)
+
+
+def _paint_icon_pixmap(icon_type, size):
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.transparent)
     
@@ -322,4 +331,4 @@ def create_icon(icon_type, size=24):
         painter.drawPolygon(arrow)
     
     painter.end()
-    return QIcon(pixmap)
+    return pixmap
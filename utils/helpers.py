@@ -4,7 +4,7 @@ import os
 import logging
 import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 
 
 def get_bundled_path(subfolder: str, filename: Optional[str] = None) -> str:
@@ -50,6 +50,63 @@ def cleanup_temp_files(temp_files: List[str]) -> None:
             logging.warning(f"Failed to delete temp file {temp_file}: {e}")
 
 
+# (size, mtime) per path for cached_stat; emptied wholesale once it reaches the limit
+_STAT_CACHE = {}
+_STAT_CACHE_LIMIT = 4096
+
+
+def cached_stat(path: str) -> Tuple[int, float]:
+    """Return (size, mtime) for path, reusing the result until clear_stat_cache().
+
+    Raises OSError like os.stat; failures are not cached.
+    """
+    cached = _STAT_CACHE.get(path)
+    if cached is None:
+        st = os.stat(path)
+        if len(_STAT_CACHE) >= _STAT_CACHE_LIMIT:
+            _STAT_CACHE.clear()
+        cached = _STAT_CACHE[path] = (st.st_size, st.st_mtime)
+    return cached
+
+
+def clear_stat_cache(path: Optional[str] = None) -> None:
+    """Forget the cached stat result for path, or for every path; call when files change on disk"""
+    if path is None:
+        _STAT_CACHE.clear()
+    else:
+        _STAT_CACHE.pop(path, None)
+
+
+# Paths sharing a folder at least this often are checked with one directory listing
+_SCANDIR_MIN_FILES = 4
+
+
+def existing_paths(paths: Iterable[str]) -> Set[str]:
+    """Return the subset of paths that exist as files.
+
+    Directories holding several of the paths are listed once with scandir
+    instead of stat-ing every file in them. Names are compared through
+    os.path.normcase, so case-insensitive filesystems match as os.stat would.
+    """
+    by_dir = {}
+    for file_path in paths:
+        by_dir.setdefault(os.path.dirname(file_path), []).append(file_path)
+    existing = set()
+    for directory, dir_paths in by_dir.items():
+        if len(dir_paths) < _SCANDIR_MIN_FILES:
+            for file_path in dir_paths:
+                if os.path.isfile(file_path):
+                    existing.add(file_path)
+            continue
+        try:
+            with os.scandir(directory or ".") as it:
+                names = {os.path.normcase(entry.name) for entry in it if entry.is_file()}
+        except OSError:
+            continue
+        existing.update(p for p in dir_paths if os.path.normcase(os.path.basename(p)) in names)
+    return existing
+
+
 def format_time(seconds: int) -> str:
     """Format seconds as MM:SS"""
     m, s = divmod(int(seconds), 60)
@@ -77,62 +134,103 @@ def send_to_recycle_bin(file_path: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    return send_files_to_recycle_bin([file_path])[0]
+
+
+def _shell_recycle_files(file_paths: List[str]) -> bool:
+    """Move files to the Windows recycle bin with a single SHFileOperationW call"""
+    import ctypes
+    from ctypes import wintypes
+    
+    # Use Windows Shell API to move file to recycle bin
+    # This is the equivalent of right-click -> Delete
+    shell32 = ctypes.windll.shell32
+    
+    # Define the structure for SHFILEOPSTRUCT
+    class SHFILEOPSTRUCT(ctypes.Structure):
+        _fields_ = [
+            ("hwnd", wintypes.HWND),
+            ("wFunc", wintypes.UINT),
+            ("pFrom", wintypes.LPCWSTR),
+            ("pTo", wintypes.LPCWSTR),
+            ("fFlags", wintypes.WORD),
+            ("fAnyOperationsAborted", wintypes.BOOL),
+            ("hNameMappings", wintypes.LPVOID),
+            ("lpszProgressTitle", wintypes.LPCWSTR)
+        ]
+    
+    # Constants
+    FO_DELETE = 0x0003
+    FOF_ALLOWUNDO = 0x0040  # Allow undo (send to recycle bin)
+    FOF_NO_UI = 0x0004      # No user interface
+    FOF_NOCONFIRMATION = 0x0010  # No confirmation dialog
+    
+    # Prepare the operation: pFrom is a null-separated list ending in a double null
+    fileop = SHFILEOPSTRUCT()
+    fileop.wFunc = FO_DELETE
+    fileop.pFrom = '\0'.join(file_paths) + '\0'
+    fileop.fFlags = FOF_ALLOWUNDO | FOF_NO_UI | FOF_NOCONFIRMATION
+    
+    # Perform the operation
+    result = shell32.SHFileOperationW(ctypes.byref(fileop))
+    return result == 0
+
+
+def send_files_to_recycle_bin(file_paths: Iterable[str]) -> List[bool]:
+    """Send several files to the recycle bin in one operation where possible.
+    
+    Args:
+        file_paths: Paths of the files to delete
+        
+    Returns:
+        A list of per-file success flags, in the same order as file_paths
+    """
+    file_paths = list(file_paths)
+    if not file_paths:
+        return []
+    results = [False] * len(file_paths)
+    remaining = list(range(len(file_paths)))
+    
+    # First try using send2trash library if available (accepts a list)
     try:
-        # First try using send2trash library if available
+        import send2trash  # type: ignore
         try:
-            import send2trash  # type: ignore
-            send2trash.send2trash(file_path)
-            return True
-        except ImportError:
-            pass
-        
-        # Fallback to Windows Shell API
-        if sys.platform == 'win32':
-            try:
-                import ctypes
-                from ctypes import wintypes
-                
-                # Use Windows Shell API to move file to recycle bin
-                # This is the equivalent of right-click -> Delete
-                shell32 = ctypes.windll.shell32
-                
-                # Define the structure for SHFILEOPSTRUCT
-                class SHFILEOPSTRUCT(ctypes.Structure):
-                    _fields_ = [
-                        ("hwnd", wintypes.HWND),
-                        ("wFunc", wintypes.UINT),
-                        ("pFrom", wintypes.LPCWSTR),
-                        ("pTo", wintypes.LPCWSTR),
-                        ("fFlags", wintypes.WORD),
-                        ("fAnyOperationsAborted", wintypes.BOOL),
-                        ("hNameMappings", wintypes.LPVOID),
-                        ("lpszProgressTitle", wintypes.LPCWSTR)
-                    ]
-                
-                # Constants
-                FO_DELETE = 0x0003
-                FOF_ALLOWUNDO = 0x0040  # Allow undo (send to recycle bin)
-                FOF_NO_UI = 0x0004      # No user interface
-                FOF_NOCONFIRMATION = 0x0010  # No confirmation dialog
-                
-                # Prepare the operation
-                fileop = SHFILEOPSTRUCT()
-                fileop.wFunc = FO_DELETE
-                fileop.pFrom = file_path + '\0'  # Must be null-terminated
-                fileop.fFlags = FOF_ALLOWUNDO | FOF_NO_UI | FOF_NOCONFIRMATION
-                
-                # Perform the operation
-                result = shell32.SHFileOperationW(ctypes.byref(fileop))
-                return result == 0
-                
-            except Exception as e:
-                logging.warning(f"Windows Shell API failed for {file_path}: {e}")
-        
-        # Final fallback - use os.remove (permanent deletion)
-        logging.warning(f"Could not send {file_path} to recycle bin, using permanent deletion")
-        os.remove(file_path)
-        return True
-        
-    except Exception as e:
-        logging.error(f"Failed to delete {file_path}: {e}")
-        return False
+            send2trash.send2trash(file_paths)
+            return [True] * len(file_paths)
+        except Exception as e:
+            logging.warning(f"Batch send2trash failed, retrying per file: {e}")
+            for i in remaining:
+                try:
+                    send2trash.send2trash(file_paths[i])
+                    results[i] = True
+                except Exception as e:
+                    logging.error(f"Failed to delete {file_paths[i]}: {e}")
+            return results
+    except ImportError:
+        pass
+    
+    # Fallback to Windows Shell API
+    if sys.platform == 'win32':
+        try:
+            _shell_recycle_files(file_paths)
+        except Exception as e:
+            logging.warning(f"Windows Shell API failed for {len(file_paths)} file(s): {e}")
+        else:
+            # The shell ran, so files it left in place are reported as failures
+            # rather than deleted permanently; it gives one status for the whole
+            # batch, so check what actually went
+            for i in remaining:
+                results[i] = not os.path.exists(file_paths[i])
+            return results
+    
+    # Final fallback - use os.remove (permanent deletion)
+    for i in remaining:
+        file_path = file_paths[i]
+        try:
+            logging.warning(f"Could not send {file_path} to recycle bin, using permanent deletion")
+            os.remove(file_path)
+            results[i] = True
+        except Exception as e:
+            logging.error(f"Failed to delete {file_path}: {e}")
+    
+    return results